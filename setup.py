@@ -6,14 +6,18 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=[
-        "pandas",
-        "boto3",
-        "pyarrow",
+        "pandas>=2.0",
+        "boto3>=1.20.0",
+        "pyarrow>=14.0",
         "azure-storage-blob>=12.0.0",
-        "google-cloud-storage>=2.0.0",
-        "pyyaml",           
-        "numpy",
+        "google-cloud-storage>=2.14.0",
+        "pyyaml>=5.1",
+        "numpy>=1.24",
     ],
+    extras_require={
+        "orjson": ["orjson>=3.3"],
+        "completion": ["argcomplete>=2.0"],
+    },
     entry_points={
         "console_scripts": [
             "datacanary=datacanary.__main__:main",
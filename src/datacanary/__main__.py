@@ -1,25 +1,30 @@
+# PYTHON_ARGCOMPLETE_OK
 """
 Main entry point for the DataCanary command-line tool.
 """
 import os
 import argparse
-import json
+import functools
 import sys
 import logging
+from datetime import datetime
 
 from datacanary import __version__
-
-from datacanary.connectors.s3_connector import S3Connector
-from datacanary.analysers.statistical_analyser import StatisticalAnalyser
-from datacanary.rules.rule_engine import (
-    RuleEngine, NullPercentageRule, UniqueValueRule, ValueRangeRule
-)
-from datacanary.reporting.report_generator import ReportGenerator
 from datacanary.utils.logging import setup_logging
 
+logger = logging.getLogger(__name__)
+
+# Heavy dependencies (pandas, pyarrow, boto3 and the cloud SDKs) are imported
+# inside the command handlers so that --help and --version stay fast.
+
+# Project root directory, where the default credentials/ folder lives
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@functools.lru_cache(maxsize=None)
 def get_default_credential_path(cloud_provider):
     """
-    Get the default path for cloud provider credentials. 
+    Get the default path for cloud provider credentials. The result is
+    cached per provider.
 
     Args:
         cloud_provider: String indicating the cloud provider ('s3', 'azure', 'gcs')
@@ -27,10 +32,6 @@ def get_default_credential_path(cloud_provider):
     Returns:
         String path to the default credential file or None if it doesn't exist
     """
-    # Get the project root directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(current_dir))  # Adjust as needed for your structure
-    
     # Define standard credential file names
     credential_files = {
         's3': 's3_credentials.csv',
@@ -42,7 +43,7 @@ def get_default_credential_path(cloud_provider):
         return None
     
     # Build the default credential path
-    cred_path = os.path.join(project_root, 'credentials', credential_files[cloud_provider])
+    cred_path = os.path.join(_PROJECT_ROOT, 'credentials', credential_files[cloud_provider])
     
     # Check if the file exists
     if os.path.exists(cred_path):
@@ -50,71 +51,162 @@ def get_default_credential_path(cloud_provider):
     
     return None
 
-def main():
-    """Main entry point for the DataCanary CLI."""
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description="DataCanary - Data Quality Tool")
-    parser.add_argument('--version', action='version', version=f'DataCanary v{__version__}')
-    
-    # Create subparsers for different commands
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+def _open_parquet(source):
+    """
+    Open a Parquet file for reading.
+
+    Column chunks are pre-buffered so that reads are coalesced and issued in
+    parallel by the Arrow I/O thread pool rather than one chunk at a time.
+
+    Args:
+        source: Path or file-like object for the Parquet file
+
+    Returns:
+        pyarrow.parquet.ParquetFile
+    """
+    import pyarrow.parquet as pq
+    return pq.ParquetFile(source, pre_buffer=True)
+
+SEPARATOR = "-" * 50
+
+def _format_overview(results):
+    """
+    Format the per-column analysis overview printed by the analyse commands.
 
-    # 'analyse' command
-    analyse_parser = subparsers.add_parser("analyse", help="analyse data statistics")
+    Args:
+        results: Dictionary of column analysis results
+
+    Returns:
+        str: The overview text, ending with a newline
+    """
+    lines = ["", "Analysis Results Overview:", SEPARATOR]
+    for column, analysis in results.items():
+        stats = analysis['stats']
+        dtype = analysis['type']
+        
+        null_pct = stats['null_percentage']
+        unique_pct = stats.get('unique_percentage', 'N/A')
+        
+        lines.append(f"Column: {column}")
+        lines.append(f"  Type: {dtype}")
+        lines.append(f"  Nulls: {stats['null_count']} ({null_pct}%)")
+        lines.append(f"  Unique Values: {stats['unique_count']} ({unique_pct}%)")
+        
+        if 'min' in stats:
+            lines.append(f"  Range: {stats['min']} to {stats['max']}")
+        elif 'min_length' in stats:
+            lines.append(f"  String Length: {stats['min_length']} to {stats['max_length']}")
+        elif 'min_date' in stats:
+            lines.append(f"  Date Range: {stats['min_date']} to {stats['max_date']}")
+        
+        lines.append(SEPARATOR)
+    lines.append("")
+    return "\n".join(lines)
+
+@functools.lru_cache(maxsize=None)
+def _source_parent():
+    """
+    Build the parent parser holding the cloud storage source options shared
+    by the 'analyse' and 'check' commands.
+    """
+    source_parent = argparse.ArgumentParser(add_help=False)
     # s3
-    analyse_parser.add_argument("--bucket", help="S3 bucket name")
-    analyse_parser.add_argument("--key", help="S3 object key (path to Parquet file)")
-    analyse_parser.add_argument("--profile", help="AWS profile name")
-    analyse_parser.add_argument("--region", help="AWS region")
+    source_parent.add_argument("--bucket", help="S3 bucket name")
+    source_parent.add_argument("--key", help="S3 object key (path to Parquet file)")
+    source_parent.add_argument("--profile", help="AWS profile name")
+    source_parent.add_argument("--region", help="AWS region")
+    source_parent.add_argument("--buffer-size", type=int, help="Size in bytes of each concurrent ranged read for S3 downloads (default: 8 MiB)")
     # azure
-    analyse_parser.add_argument("--azure-container", help="Azure Blob Storage container name")
-    analyse_parser.add_argument("--azure-blob", help="Azure Blob Storage blob name (path to Parquet file)")
-    analyse_parser.add_argument("--azure-connection-string", help="Azure Storage connection string")
-    analyse_parser.add_argument("--azure-account-url", help="Azure Storage account URL")
-    analyse_parser.add_argument("--azure-account-key", help="Azure Storage account key")
+    source_parent.add_argument("--azure-container", help="Azure Blob Storage container name")
+    source_parent.add_argument("--azure-blob", help="Azure Blob Storage blob name (path to Parquet file)")
+    source_parent.add_argument("--azure-connection-string", help="Azure Storage connection string")
+    source_parent.add_argument("--azure-account-url", help="Azure Storage account URL")
+    source_parent.add_argument("--azure-account-key", help="Azure Storage account key")
     # gcs
-    analyse_parser.add_argument("--gcs-bucket", help="Google Cloud Storage bucket name")
-    analyse_parser.add_argument("--gcs-blob", help="Google Cloud Storage blob name (path to Parquet file)")
-    analyse_parser.add_argument("--gcs-credentials", help="Path to GCS service account JSON key file")
-    analyse_parser.add_argument("--gcs-project", help="Google Cloud project ID")
+    source_parent.add_argument("--gcs-bucket", help="Google Cloud Storage bucket name")
+    source_parent.add_argument("--gcs-blob", help="Google Cloud Storage blob name (path to Parquet file)")
+    source_parent.add_argument("--gcs-credentials", help="Path to GCS service account JSON key file")
+    source_parent.add_argument("--gcs-project", help="Google Cloud project ID")
+    return source_parent
+
+def _add_analyse_parser(subparsers):
+    """Register the 'analyse' command."""
+    analyse_parser = subparsers.add_parser("analyse", parents=[_source_parent()], help="analyse data statistics")
     #generic
     analyse_parser.add_argument("--output", help="Output file path for JSON results")
+    analyse_parser.add_argument("--quiet", action="store_true", help="Do not print the analysis overview")
 
-    # 'analyse-local' command for local files
+def _add_analyse_local_parser(subparsers):
+    """Register the 'analyse-local' command for local files."""
     analyse_local_parser = subparsers.add_parser("analyse-local", help="analyse data statistics for local file")
     analyse_local_parser.add_argument("--file", required=True, help="Path to local Parquet file")
     analyse_local_parser.add_argument("--output", help="Output file path for JSON results")
+    analyse_local_parser.add_argument("--quiet", action="store_true", help="Do not print the analysis overview")
 
-    # 'check' command
-    check_parser = subparsers.add_parser("check", help="Run data quality checks")
-    # s3
-    check_parser.add_argument("--bucket", help="S3 bucket name")
-    check_parser.add_argument("--key", help="S3 object key (path to Parquet file)")
-    check_parser.add_argument("--profile", help="AWS profile name")
-    check_parser.add_argument("--region", help="AWS region")
-    # azure
-    check_parser.add_argument("--azure-container", help="Azure Blob Storage container name")
-    check_parser.add_argument("--azure-blob", help="Azure Blob Storage blob name (path to Parquet file)")
-    check_parser.add_argument("--azure-connection-string", help="Azure Storage connection string")
-    check_parser.add_argument("--azure-account-url", help="Azure Storage account URL")
-    check_parser.add_argument("--azure-account-key", help="Azure Storage account key")
-    # gcs
-    check_parser.add_argument("--gcs-bucket", help="Google Cloud Storage bucket name")
-    check_parser.add_argument("--gcs-blob", help="Google Cloud Storage blob name (path to Parquet file)")
-    check_parser.add_argument("--gcs-credentials", help="Path to GCS service account JSON key file")
-    check_parser.add_argument("--gcs-project", help="Google Cloud project ID")
+def _add_check_parser(subparsers):
+    """Register the 'check' command."""
+    check_parser = subparsers.add_parser("check", parents=[_source_parent()], help="Run data quality checks")
     #generic
     check_parser.add_argument("--report", help="Output file path for the text report")
     check_parser.add_argument("--json", help="Output file path for the JSON results")
     check_parser.add_argument("--rules", help="Path to rule configuration file (YAML or JSON)")
 
-    # 'check-local' command for local files
+def _add_check_local_parser(subparsers):
+    """Register the 'check-local' command for local files."""
     check_local_parser = subparsers.add_parser("check-local", help="Run data quality checks on local file")
     check_local_parser.add_argument("--file", required=True, help="Path to local Parquet file")
     check_local_parser.add_argument("--report", help="Output file path for the text report")
     check_local_parser.add_argument("--json", help="Output file path for the JSON results")
     check_local_parser.add_argument("--rules", help="Path to rule configuration file (YAML or JSON)")
 
+# Command name -> function registering its subparser, in help order
+_COMMAND_PARSERS = {
+    "analyse": _add_analyse_parser,
+    "analyse-local": _add_analyse_local_parser,
+    "check": _add_check_parser,
+    "check-local": _add_check_local_parser,
+}
+
+def _sniff_subcommand(argv):
+    """
+    Return the first positional token on the command line, if any.
+
+    Args:
+        argv: Full argument vector (including the program name)
+
+    Returns:
+        The candidate command name or None
+    """
+    return next((a for a in argv[1:] if not a.startswith('-')), None)
+
+def main():
+    """Main entry point for the DataCanary CLI."""
+    # Set up argument parser
+    parser = argparse.ArgumentParser(description="DataCanary - Data Quality Tool")
+    parser.add_argument('--version', action='version', version=f'DataCanary v{__version__}')
+    
+    # Create subparsers for different commands
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    # Only build the parser for the requested command; fall back to all of
+    # them so that --help and unknown commands still list every choice
+    command = _sniff_subcommand(sys.argv)
+    if command in _COMMAND_PARSERS:
+        _COMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(subparsers)
+
+    # Enable shell tab completion when argcomplete is installed. During
+    # completion this exits before any command module is imported. The
+    # shell hook sets _ARGCOMPLETE, so normal runs skip importing it.
+    if "_ARGCOMPLETE" in os.environ:
+        try:
+            import argcomplete
+            argcomplete.autocomplete(parser)
+        except ImportError:
+            pass
+
     # Parse arguments
     args = parser.parse_args()
     
@@ -136,59 +228,60 @@ def main():
     elif args.command == "check-local":
         run_check_local(args)
 
-def run_analyse(args):
-    """Run the analyse command."""
+def _load_dataframe(args):
+    """
+    Read the Parquet file selected by the cloud storage arguments.
+
+    Args:
+        args: Parsed arguments of the analyse or check command
+
+    Returns:
+        Tuple of (DataFrame, data source URI)
+    """
     # Verify that at least one cloud provider's arguments are specified
     has_s3_args = args.bucket and args.key
     has_azure_args = args.azure_container and args.azure_blob
     has_gcs_args = args.gcs_bucket and args.gcs_blob
 
     if not (has_s3_args or has_azure_args or has_gcs_args):
-        print("Error: You must specify either S3 (--bucket and --key), "
-              "Azure (--azure-container and --azure-blob), or "
-              "GCS (--gcs-bucket and --gcs-blob) source")
+        logger.error("You must specify either S3 (--bucket and --key), "
+                     "Azure (--azure-container and --azure-blob), or "
+                     "GCS (--gcs-bucket and --gcs-blob) source")
         sys.exit(1)
     
     # Determine which connector to use
     if has_s3_args:
+        from datacanary.connectors.s3_connector import S3Connector
+        from datacanary.connectors.credentials import load_s3_credentials
+
         aws_profile = args.profile
 
         if not aws_profile:
             default_creds = get_default_credential_path('s3')
             if default_creds:
                 try:
-                    import csv
-                    with open(default_creds, 'r') as f:
-                        csv_reader = csv.reader(f)
-                        # Skip header row
-                        headers = next(csv_reader)
-                        # Read credentials row
-                        for row in csv_reader:
-                            # Should only be one row with credentials
-                            if len(row) >= 2:
-                                aws_access_key = row[0]
-                                aws_secret_key = row[1]
-                                break
-                    if aws_access_key and aws_secret_key:
-                        os.environ['AWS_ACCESS_KEY_ID'] = aws_access_key
-                        os.environ['AWS_SECRET_ACCESS_KEY'] = aws_secret_key
-                        print(f"Using AWS credentials from: {default_creds}")
+                    keys = load_s3_credentials(default_creds)
+                    if keys and all(keys):
+                        os.environ['AWS_ACCESS_KEY_ID'], os.environ['AWS_SECRET_ACCESS_KEY'] = keys
+                        logger.info("Using AWS credentials from: %s", default_creds)
                 except Exception as e:
-                    print(f"Error loading S3 credentials: {e}")
+                    logger.error("Error loading S3 credentials: %s", e)
         # Use S3 connector
         connector = S3Connector(
             aws_profile=args.profile,
-            aws_region=args.region
+            aws_region=args.region,
+            buffer_size=args.buffer_size
         )
         data_source = f"s3://{args.bucket}/{args.key}"
         try:
             df = connector.read_parquet(args.bucket, args.key)
         except Exception as e:
-            print(f"Error reading data from S3: {e}")
+            logger.error("Error reading data from S3: %s", e)
             sys.exit(1)
     elif has_azure_args:
         # Use Azure connector
         from datacanary.connectors.azure_connector import AzureConnector
+        from datacanary.connectors.credentials import load_azure_credentials
 
         connection_string = args.azure_connection_string
         account_url = args.azure_account_url
@@ -197,30 +290,26 @@ def run_analyse(args):
         if not (connection_string or (account_url and account_key)):
             default_creds = get_default_credential_path('azure')
             if default_creds:
-                print(f"Using default Azure credentials from: {default_creds}")
+                logger.info("Using default Azure credentials from: %s", default_creds)
                 try:
-                    with open(default_creds, 'r') as f:
-                        creds = json.load(f)
-                        connection_string = creds.get('connection_string')
-                        account_url = creds.get('account_url')
-                        account_key = creds.get('account_key')
+                    connection_string, account_url, account_key = load_azure_credentials(default_creds)
                 except Exception as e:
-                    print(f"Error loading Azure credentials: {e}")
+                    logger.error("Error loading Azure credentials: %s", e)
 
         try:
             connector = AzureConnector(
-                connection_string=args.azure_connection_string,
-                account_url=args.azure_account_url,
-                account_key=args.azure_account_key
+                connection_string=connection_string,
+                account_url=account_url,
+                account_key=account_key
             )
             data_source = f"azure://{args.azure_container}/{args.azure_blob}"
             df = connector.read_parquet(args.azure_container, args.azure_blob)
         except Exception as e:
-            print(f"Error reading data from Azure: {e}")
+            logger.error("Error reading data from Azure: %s", e)
             sys.exit(1)
 
-    elif has_gcs_args:
-        # Use GCS connector
+    else:
+        # Use GCS connector; the check above guarantees its arguments are set
         from datacanary.connectors.gcs_connector import GCSConnector
         
         # CHANGED: Added default credential handling for GCS
@@ -230,7 +319,7 @@ def run_analyse(args):
         if not credentials_path:
             default_creds = get_default_credential_path('gcs')
             if default_creds:
-                print(f"Using default GCS credentials from: {default_creds}")
+                logger.info("Using default GCS credentials from: %s", default_creds)
                 credentials_path = default_creds
         
         try:
@@ -241,159 +330,45 @@ def run_analyse(args):
             data_source = f"gs://{args.gcs_bucket}/{args.gcs_blob}"
             df = connector.read_parquet(args.gcs_bucket, args.gcs_blob)
         except Exception as e:
-            print(f"Error reading data from GCS: {e}")
+            logger.error("Error reading data from GCS: %s", e)
             sys.exit(1)
 
-    else:
-        print("Error: You must specify either S3 (--bucket and --key) or Azure (--azure-container and --azure-blob) source")
-        sys.exit(1)
+    return df, data_source
+
+def run_analyse(args):
+    """Run the analyse command."""
+    from datacanary.analysers.statistical_analyser import StatisticalAnalyser
+    from datacanary.utils.serialization import dump_json
+
+    df, data_source = _load_dataframe(args)
+
     analyser = StatisticalAnalyser()
     
     # analyse the data
-    print("Analysing data...")
+    logger.info("Analysing data...")
     results = analyser.analyse_dataframe(df)
     
     # Display overview of the analysis
-    print("\nAnalysis Results Overview:")
-    print("-" * 50)
-    for column, analysis in results.items():
-        stats = analysis['stats']
-        dtype = analysis['type']
-        
-        null_pct = stats['null_percentage']
-        unique_pct = stats.get('unique_percentage', 'N/A')
-        
-        print(f"Column: {column}")
-        print(f"  Type: {dtype}")
-        print(f"  Nulls: {stats['null_count']} ({null_pct}%)")
-        print(f"  Unique Values: {stats['unique_count']} ({unique_pct}%)")
-        
-        if 'min' in stats:
-            print(f"  Range: {stats['min']} to {stats['max']}")
-        elif 'min_length' in stats:
-            print(f"  String Length: {stats['min_length']} to {stats['max_length']}")
-        elif 'min_date' in stats:
-            print(f"  Date Range: {stats['min_date']} to {stats['max_date']}")
-        
-        print("-" * 50)
+    if not args.quiet:
+        sys.stdout.write(_format_overview(results))
     
     # Save results to a file if requested
     if args.output:
-        print(f"Saving analysis results to {args.output}")
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print("Results saved successfully")
+        logger.info("Saving analysis results to %s", args.output)
+        dump_json(results, args.output)
+        logger.info("Results saved successfully")
 
 def run_check(args):
     """Run the check command."""
-    # Verify that at least one cloud provider's arguments are specified
-    has_s3_args = args.bucket and args.key
-    has_azure_args = args.azure_container and args.azure_blob
-    has_gcs_args = args.gcs_bucket and args.gcs_blob
+    from datacanary.analysers.statistical_analyser import StatisticalAnalyser
+    from datacanary.rules.rule_engine import (
+        RuleEngine, NullPercentageRule, UniqueValueRule, ValueRangeRule
+    )
+    from datacanary.reporting.report_generator import ReportGenerator
+    from datacanary.utils.serialization import dump_json
 
-    if not (has_s3_args or has_azure_args or has_gcs_args):
-        print("Error: You must specify either S3 (--bucket and --key), "
-              "Azure (--azure-container and --azure-blob), or "
-              "GCS (--gcs-bucket and --gcs-blob) source")
-        sys.exit(1)
+    df, data_source = _load_dataframe(args)
 
-    # Determine which connector to use
-    if has_s3_args:
-        aws_profile = args.profile
-
-        if not aws_profile:
-            default_creds = get_default_credential_path('s3')
-            if default_creds:
-                try:
-                    import csv
-                    with open(default_creds, 'r') as f:
-                        csv_reader = csv.reader(f)
-                        # Skip header row
-                        headers = next(csv_reader)
-                        # Read credentials row
-                        for row in csv_reader:
-                            # Should only be one row with credentials
-                            if len(row) >= 2:
-                                aws_access_key = row[0]
-                                aws_secret_key = row[1]
-                                break
-                    if aws_access_key and aws_secret_key:
-                        os.environ['AWS_ACCESS_KEY_ID'] = aws_access_key
-                        os.environ['AWS_SECRET_ACCESS_KEY'] = aws_secret_key
-                        print(f"Using AWS credentials from: {default_creds}")
-                except Exception as e:
-                    print(f"Error loading S3 credentials: {e}")
-        # Use S3 connector
-        connector = S3Connector(
-            aws_profile=args.profile,
-            aws_region=args.region
-        )
-        data_source = f"s3://{args.bucket}/{args.key}"
-        try:
-            df = connector.read_parquet(args.bucket, args.key)
-        except Exception as e:
-            print(f"Error reading data from S3: {e}")
-            sys.exit(1)
-    elif has_azure_args:
-        # Use Azure connector
-        from datacanary.connectors.azure_connector import AzureConnector
-
-        connection_string = args.azure_connection_string
-        account_url = args.azure_account_url
-        account_key = args.azure_account_key
-
-        if not (connection_string or (account_url and account_key)):
-            default_creds = get_default_credential_path('azure')
-            if default_creds:
-                print(f"Using default Azure credentials from: {default_creds}")
-                try:
-                    with open(default_creds, 'r') as f:
-                        creds = json.load(f)
-                        connection_string = creds.get('connection_string')
-                        account_url = creds.get('account_url')
-                        account_key = creds.get('account_key')
-                except Exception as e:
-                    print(f"Error loading Azure credentials: {e}")
-        try:
-            connector = AzureConnector(
-                connection_string=args.azure_connection_string,
-                account_url=args.azure_account_url,
-                account_key=args.azure_account_key
-            )
-            data_source = f"azure://{args.azure_container}/{args.azure_blob}"
-            df = connector.read_parquet(args.azure_container, args.azure_blob)
-        except Exception as e:
-            print(f"Error reading data from Azure: {e}")
-            sys.exit(1)
-
-    elif has_gcs_args:
-        # Use GCS connector
-        from datacanary.connectors.gcs_connector import GCSConnector
-        
-        # CHANGED: Added default credential handling for GCS
-        credentials_path = args.gcs_credentials
-        
-        # NEW: Check for default GCS credentials if not explicitly provided
-        if not credentials_path:
-            default_creds = get_default_credential_path('gcs')
-            if default_creds:
-                print(f"Using default GCS credentials from: {default_creds}")
-                credentials_path = default_creds
-        
-        try:
-            connector = GCSConnector(
-                credentials_path=credentials_path,
-                project_id=args.gcs_project
-            )
-            data_source = f"gs://{args.gcs_bucket}/{args.gcs_blob}"
-            df = connector.read_parquet(args.gcs_bucket, args.gcs_blob)
-        except Exception as e:
-            print(f"Error reading data from GCS: {e}")
-            sys.exit(1)
-
-    else:
-        print("Error: You must specify either S3 (--bucket and --key) or Azure (--azure-container and --azure-blob) source")
-        sys.exit(1)
     analyser = StatisticalAnalyser()
     engine = RuleEngine()
     reporter = ReportGenerator()
@@ -409,19 +384,18 @@ def run_check(args):
         engine.add_rule(ValueRangeRule(min_value=0))
     
     # analyse the data
-    print("Analysing data...")
+    logger.info("Analysing data...")
     analysis_results = analyser.analyse_dataframe(df)
     
     # Evaluate the rules
-    print("Evaluating data quality rules...")
+    logger.info("Evaluating data quality rules...")
     rule_results = engine.evaluate_dataframe(analysis_results)
 
     # After rule evaluation, generate insights
     from datacanary.analysis.summary_statistics import SummaryStatistics
     from datacanary.analysis.trend_detection import TrendDetector
 
-    # Get summary statistics and health score
-    summary_stats = SummaryStatistics().calculate_summary(analysis_results)
+    # Get health score
     health_score = SummaryStatistics().get_health_score(analysis_results, rule_results)
 
     # Get insights
@@ -447,77 +421,64 @@ def run_check(args):
     
     # Save report to a file if requested
     if args.report:
-        print(f"Saving report to {args.report}")
+        logger.info("Saving report to %s", args.report)
         with open(args.report, 'w') as f:
             f.write(report)
     
     # Save results to a JSON file if requested
     if args.json:
-        print(f"Saving JSON results to {args.json}")
-        from datetime import datetime
+        logger.info("Saving JSON results to %s", args.json)
         results = {
-            "dataset": args.key,
+            "dataset": data_source,
             "timestamp": datetime.now().isoformat(),
             "analysis": analysis_results,
             "rule_results": rule_results
         }
-        with open(args.json, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        dump_json(results, args.json)
 
 def run_analyse_local(args):
     """
     Run the analyse command on a local file 
     """
+    from datacanary.analysers.statistical_analyser import StatisticalAnalyser
+    from datacanary.utils.serialization import dump_json
+
     analyser = StatisticalAnalyser()
 
-    print(f"Reading data from {args.file}")
+    logger.info("Reading data from %s", args.file)
     try:
-        import pandas as pd
-        df = pd.read_parquet(args.file)
-        print(f"Read {len(df)} rows and {len(df.columns)} columns")
+        parquet_file = _open_parquet(args.file)
+        logger.info("Found %d rows and %d columns",
+                    parquet_file.metadata.num_rows, len(parquet_file.schema_arrow))
     except Exception as e:
-        print(f"Error reading data: {e}")
+        logger.error("Error reading data: %s", e)
         sys.exit(1)
     
     # analyse the data
-    print("Analysing data...")
-    results = analyser.analyse_dataframe(df)
+    logger.info("Analysing data...")
+    results = analyser.analyse_parquet_file(parquet_file)
     
     # Display overview of the analysis
-    print("\nAnalysis Results Overview:")
-    print("-" * 50)
-    for column, analysis in results.items():
-        stats = analysis['stats']
-        dtype = analysis['type']
-        
-        null_pct = stats['null_percentage']
-        unique_pct = stats.get('unique_percentage', 'N/A')
-        
-        print(f"Column: {column}")
-        print(f"  Type: {dtype}")
-        print(f"  Nulls: {stats['null_count']} ({null_pct}%)")
-        print(f"  Unique Values: {stats['unique_count']} ({unique_pct}%)")
-        
-        if 'min' in stats:
-            print(f"  Range: {stats['min']} to {stats['max']}")
-        elif 'min_length' in stats:
-            print(f"  String Length: {stats['min_length']} to {stats['max_length']}")
-        elif 'min_date' in stats:
-            print(f"  Date Range: {stats['min_date']} to {stats['max_date']}")
-        
-        print("-" * 50)
+    if not args.quiet:
+        sys.stdout.write(_format_overview(results))
     
     # Save results to a file if requested
     if args.output:
-        print(f"Saving analysis results to {args.output}")
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print("Results saved successfully")
+        logger.info("Saving analysis results to %s", args.output)
+        dump_json(results, args.output)
+        logger.info("Results saved successfully")
 
 def run_check_local(args):
     """
     Run the check command on a local file.
     """
+    from datacanary.analysers.statistical_analyser import StatisticalAnalyser
+    from datacanary.rules.rule_engine import (
+        RuleEngine, NullPercentageRule, UniqueValueRule, ValueRangeRule
+    )
+    from datacanary.reporting.report_generator import ReportGenerator
+    from datacanary.utils.serialization import dump_json
+
     analyser = StatisticalAnalyser()
     engine = RuleEngine()
     reporter = ReportGenerator()
@@ -533,29 +494,28 @@ def run_check_local(args):
         engine.add_rule(ValueRangeRule(min_value=0))
     
     # Read the local file
-    print(f"Reading data from {args.file}")
+    logger.info("Reading data from %s", args.file)
     try:
-        import pandas as pd
-        df = pd.read_parquet(args.file)
-        print(f"Read {len(df)} rows and {len(df.columns)} columns")
+        parquet_file = _open_parquet(args.file)
+        logger.info("Found %d rows and %d columns",
+                    parquet_file.metadata.num_rows, len(parquet_file.schema_arrow))
     except Exception as e:
-        print(f"Error reading data: {e}")
+        logger.error("Error reading data: %s", e)
         sys.exit(1)
 
     # analyse the data
-    print("Analysing data...")
-    analysis_results = analyser.analyse_dataframe(df)
+    logger.info("Analysing data...")
+    analysis_results = analyser.analyse_parquet_file(parquet_file)
     
     # Evaluate the rules
-    print("Evaluating data quality rules...")
+    logger.info("Evaluating data quality rules...")
     rule_results = engine.evaluate_dataframe(analysis_results)
 
     # After rule evaluation, generate insights
     from datacanary.analysis.summary_statistics import SummaryStatistics
     from datacanary.analysis.trend_detection import TrendDetector
     
-    # Get summary statistics and health score
-    summary_stats = SummaryStatistics().calculate_summary(analysis_results)
+    # Get health score
     health_score = SummaryStatistics().get_health_score(analysis_results, rule_results)
     
     # Get insights
@@ -581,22 +541,20 @@ def run_check_local(args):
     
     # Save report to a file if requested
     if args.report:
-        print(f"Saving report to {args.report}")
+        logger.info("Saving report to %s", args.report)
         with open(args.report, 'w') as f:
             f.write(report)
     
     # Save results to a JSON file if requested
     if args.json:
-        print(f"Saving JSON results to {args.json}")
-        from datetime import datetime
+        logger.info("Saving JSON results to %s", args.json)
         results = {
-            "dataset": args.key,
+            "dataset": args.file,
             "timestamp": datetime.now().isoformat(),
             "analysis": analysis_results,
             "rule_results": rule_results
         }
-        with open(args.json, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        dump_json(results, args.json)
 
 
 if __name__ == "__main__":
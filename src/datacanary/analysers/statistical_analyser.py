@@ -3,27 +3,76 @@ Statistical analyzer for DataCanary.
 Performs basic statistical analysis on DataFrame columns.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 logger = logging.getLogger(__name__)
 
+def _column_category(col_data):
+    """
+    Classify a column as 'numeric', 'string' or 'datetime'.
+
+    Plain NumPy dtypes are dispatched on dtype.kind; extension dtypes
+    (nullable, categorical, Arrow-backed) use the pandas type checks.
+
+    Args:
+        col_data: The column as a pandas Series
+
+    Returns:
+        The category name, or None for other dtypes
+    """
+    dtype = col_data.dtype
+    if isinstance(dtype, np.dtype):
+        kind = dtype.kind
+        if kind in 'iufcb':
+            return 'numeric'
+        if kind in 'OSU':
+            return 'string'
+        if kind == 'M':
+            return 'datetime'
+        return None
+
+    if pd.api.types.is_numeric_dtype(col_data):
+        return 'numeric'
+    if pd.api.types.is_string_dtype(col_data) or pd.api.types.is_object_dtype(col_data):
+        return 'string'
+    if pd.api.types.is_datetime64_dtype(col_data):
+        return 'datetime'
+    return None
+
 class StatisticalAnalyser:
     """
     Performs statistical analysis on DataFrame columns to identify
     potential data quality issues.
     """
 
+    def __init__(self, max_workers=None):
+        """
+        Initialise the analyser.
+
+        Args:
+            max_workers: Maximum number of columns analysed in parallel
+                (defaults to the ThreadPoolExecutor default; 1 disables threading)
+        """
+        self.max_workers = max_workers
+
     def analyse_dataframe(self, df):
         """
         Analyse a pandas DataFrame and return statistics for each column.
 
         Args:
-            df: The DataFrame to to analyse
+            df: The DataFrame to to analyse (a pyarrow Table is also accepted)
 
         Returns:
             dict: Dictionary of column statistics
         """
+        if isinstance(df, pa.Table):
+            # Release Arrow buffers column by column as they are converted
+            df = df.to_pandas(split_blocks=True, self_destruct=True)
+
         if not isinstance(df, pd.DataFrame):
             logger.error("Input is not a pandas DataFrame")
             raise TypeError("Input must be a pandas DataFrame")
@@ -32,67 +81,144 @@ class StatisticalAnalyser:
             logger.warning("Empty DataFrame provided for analysis")
             return {}
     
-        logger.info(f"Analyzing DataFrame with {len(df)} rows and {len(df.columns)} columns")
+        logger.info("Analyzing DataFrame with %d rows and %d columns", len(df), len(df.columns))
 
-        results = {}
+        columns = list(df.columns)
+
+        # Columns are independent and the heavy reductions release the GIL,
+        # so analyse them concurrently. map() keeps the column order.
+        if self.max_workers == 1 or len(columns) == 1:
+            column_results = [self._analyse_column(column, df[column]) for column in columns]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                column_results = list(executor.map(
+                    lambda column: self._analyse_column(column, df[column]), columns
+                ))
 
-        for column in df.columns:
-            logger.debug(f'Analysing column: {column}')
-            col_data = df[column]
-
-            stats = {
-                "count": len(col_data),
-                "null_count": col_data.isna().sum(),
-                "null_percentage": round(col_data.isna().mean() * 100, 2),
-                "unique_count": col_data.nunique(),
-                "unique_percentage": round(col_data.nunique() / len(col_data) * 100, 2) if len(col_data) > 0 else 0,
-                "has_duplicates": col_data.duplicated().any()
-            }
-
-            if pd.api.types.is_numeric_dtype(col_data):
-                non_null_data = col_data.dropna()
-                if len(non_null_data) > 0:
-                    stats.update({
-                        "min": float(non_null_data.min()),
-                        "max": float(non_null_data.max()),
-                        "mean": float(non_null_data.mean()),
-                        "median": float(non_null_data.median()),
-                        "std_dev": float(non_null_data.std()) if len(non_null_data) > 1 else 0,
-                        "zeros_count": (non_null_data == 0).sum(),
-                        "zeros_percentage": round((non_null_data == 0).mean() * 100, 2),
-                        "negative_count": (non_null_data < 0).sum()
-                    })
-
-            # For string/object columns, add sample value collection:
-            elif pd.api.types.is_string_dtype(col_data) or pd.api.types.is_object_dtype(col_data):
-                non_null_data = col_data.dropna()
-                if len(non_null_data) > 0:
-                    # Calculate string lengths
-                    str_lengths = non_null_data.astype(str).str.len()
-                    stats.update({
-                        "min_length": int(str_lengths.min()),
-                        "max_length": int(str_lengths.max()),
-                        "mean_length": float(str_lengths.mean()),
-                        "empty_string_count": (non_null_data == "").sum(),
-                        "empty_string_percentage": round((non_null_data == "").mean() * 100, 2),
-                        # Add sample values for pattern matching (up to 10 samples)
-                        "sample_values": non_null_data.sample(min(10, len(non_null_data))).tolist()
-                    })
-
-            elif pd.api.types.is_datetime64_dtype(col_data):
-                non_null_data = col_data.dropna()
-                if len(non_null_data) > 0:
-                    stats.update({
-                        "min_date": non_null_data.min().strftime("%Y-%m-%d %H:%M:%S"),
-                        "max_date": non_null_data.max().strftime("%Y-%m-%d %H:%M:%S"),
-                        "range_days": (non_null_data.max() - non_null_data.min()).days
-                    })
-
-            # Store results for this column
-            results[column] = {
-                "type": str(col_data.dtype),
-                "stats": stats
-            }
+        results = dict(zip(columns, column_results))
         
-        logger.info(f"Completed analysis of {len(results)} columns")
-        return results
\ No newline at end of file
+        logger.info("Completed analysis of %d columns", len(results))
+        return results
+
+    def analyse_parquet_file(self, parquet_file):
+        """
+        Analyse a Parquet file one column at a time.
+
+        Only a single column is read and converted to pandas at any time,
+        so peak memory is bounded by the widest column rather than the
+        whole table.
+
+        Args:
+            parquet_file: An open pyarrow.parquet.ParquetFile
+
+        Returns:
+            dict: Dictionary of column statistics
+        """
+        schema = parquet_file.schema_arrow
+        pandas_metadata = schema.pandas_metadata or {}
+        # Serialised pandas indexes are stored as regular columns
+        index_columns = {
+            name for name in pandas_metadata.get('index_columns', []) if isinstance(name, str)
+        }
+        columns = [name for name in schema.names if name not in index_columns]
+        num_rows = parquet_file.metadata.num_rows
+
+        if num_rows == 0 or not columns:
+            logger.warning("Empty DataFrame provided for analysis")
+            return {}
+
+        logger.info("Analyzing DataFrame with %d rows and %d columns", num_rows, len(columns))
+
+        results = {}
+        for column in columns:
+            table = parquet_file.read(columns=[column])
+            col_data = table.to_pandas(self_destruct=True)[column]
+            results[column] = self._analyse_column(column, col_data)
+
+        logger.info("Completed analysis of %d columns", len(results))
+        return results
+
+    def _analyse_column(self, column, col_data):
+        """
+        Compute statistics for a single column.
+
+        Args:
+            column: Column name
+            col_data: The column as a pandas Series
+
+        Returns:
+            dict: Column type and statistics
+        """
+        logger.debug('Analysing column: %s', column)
+
+        # Compute the null mask once and derive every null-based metric from it
+        null_mask = col_data.isna().to_numpy()
+        count = col_data.shape[0]
+        null_count = int(null_mask.sum())
+        non_null_count = count - null_count
+        unique_count = col_data.nunique()
+
+        stats = {
+            "count": count,
+            "null_count": null_count,
+            "null_percentage": round(null_count / count * 100, 2),
+            "unique_count": unique_count,
+            "unique_percentage": round(unique_count / count * 100, 2) if count > 0 else 0,
+            # Repeated nulls count as duplicates, as with Series.duplicated()
+            "has_duplicates": unique_count < non_null_count or null_count > 1
+        }
+
+        category = _column_category(col_data)
+
+        if category == 'numeric':
+            if non_null_count > 0:
+                non_null = col_data.to_numpy(dtype=np.float64, na_value=np.nan)[~null_mask]
+                zeros_count = np.count_nonzero(non_null == 0)
+                stats.update({
+                    "min": float(non_null.min()),
+                    "max": float(non_null.max()),
+                    "mean": float(non_null.mean()),
+                    "median": float(np.median(non_null)),
+                    "std_dev": float(non_null.std(ddof=1)) if non_null_count > 1 else 0,
+                    "zeros_count": zeros_count,
+                    "zeros_percentage": round(zeros_count / non_null_count * 100, 2),
+                    "negative_count": np.count_nonzero(non_null < 0)
+                })
+
+        # For string/object columns, add sample value collection:
+        elif category == 'string':
+            if non_null_count > 0:
+                non_null_data = col_data[~null_mask]
+                # Calculate string lengths with Arrow's native kernel. Mixed
+                # object columns are converted with str() first.
+                try:
+                    str_values = pa.array(non_null_data, type=pa.string())
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    str_values = pa.array(non_null_data.astype(str), type=pa.string())
+                str_lengths = pc.utf8_length(str_values).to_numpy(zero_copy_only=False)
+                empty_string_count = int(np.count_nonzero(str_lengths == 0))
+                stats.update({
+                    "min_length": int(str_lengths.min()),
+                    "max_length": int(str_lengths.max()),
+                    "mean_length": float(str_lengths.mean()),
+                    "empty_string_count": empty_string_count,
+                    "empty_string_percentage": round(empty_string_count / non_null_count * 100, 2),
+                    # Add sample values for pattern matching (up to 10 samples)
+                    "sample_values": non_null_data.sample(min(10, non_null_count)).tolist()
+                })
+
+        elif category == 'datetime':
+            if non_null_count > 0:
+                non_null_data = col_data[~null_mask]
+                min_date = non_null_data.min()
+                max_date = non_null_data.max()
+                stats.update({
+                    "min_date": min_date.isoformat(sep=' ', timespec='seconds'),
+                    "max_date": max_date.isoformat(sep=' ', timespec='seconds'),
+                    "range_days": (max_date - min_date).days
+                })
+
+        return {
+            "type": str(col_data.dtype),
+            "stats": stats
+        }
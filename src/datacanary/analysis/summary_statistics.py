@@ -3,11 +3,41 @@ Summary statistics module for DataCanary.
 Provides overall dataset statistics and health metrics.
 """
 import logging
+from collections import Counter
+from operator import itemgetter
 import pandas as pd
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_get_result = itemgetter('result')
+
+def _empty_summary():
+    """
+    Build the summary returned for a dataset without any analysed columns.
+
+    Returns:
+        Dictionary with the same keys as a full summary, all zeroed
+    """
+    return {
+        "dataset_statistics": {
+            "total_columns": 0,
+            "column_types": {},
+            "columns_with_nulls": 0,
+            "columns_with_nulls_percentage": 0,
+            "avg_null_percentage": 0,
+            "avg_unique_percentage": 0
+        },
+        "data_quality_indicators": {
+            "completeness": 0,
+            "uniqueness": 0
+        },
+        "notable_columns": {
+            "highest_null_column": {"name": None, "percentage": 0},
+            "lowest_unique_column": {"name": None, "percentage": 100}
+        }
+    }
+
 class SummaryStatistics:
     """
     Generates summary statistics for an entire dataset
@@ -27,42 +57,51 @@ class SummaryStatistics:
         
         if not analysis_results:
             logger.warning("No analysis results provided for summary calculation")
-            return {}
-        
-        # Initialize counters and statistics
-        total_columns = len(analysis_results)
-        column_types = {}
-        total_null_percentage = 0
-        columns_with_nulls = 0
-        total_unique_percentage = 0
+            return _empty_summary()
+        
+        # Gather the per-column scalars once and reduce them with NumPy
+        column_names = list(analysis_results)
+        total_columns = len(column_names)
+        column_stats = [analysis_results[name].get('stats', {}) for name in column_names]
+        null_percentages = np.fromiter(
+            (stats.get('null_percentage', 0) for stats in column_stats),
+            dtype=np.float64, count=total_columns
+        )
+        unique_percentages = np.fromiter(
+            (stats.get('unique_percentage', 0) for stats in column_stats),
+            dtype=np.float64, count=total_columns
+        )
+
+        # Count column types
+        column_types = dict(Counter(
+            column_data.get('type', 'unknown') for column_data in analysis_results.values()
+        ))
+
+        # Collect null statistics
+        total_null_percentage = null_percentages.sum()
+        columns_with_nulls = int(np.count_nonzero(null_percentages > 0))
         highest_null_column = {"name": None, "percentage": 0}
+        highest_idx = null_percentages.argmax()
+        if null_percentages[highest_idx] > 0:
+            highest_null_column = {
+                "name": column_names[highest_idx],
+                "percentage": column_stats[highest_idx]['null_percentage']
+            }
+
+        # Collect uniqueness statistics (the lowest non-zero percentage)
+        total_unique_percentage = unique_percentages.sum()
         lowest_unique_column = {"name": None, "percentage": 100}
-        
-        # Process each column
-        for column_name, column_data in analysis_results.items():
-            column_type = column_data.get('type', 'unknown')
-            stats = column_data.get('stats', {})
-            
-            # Count column types
-            column_types[column_type] = column_types.get(column_type, 0) + 1
-            
-            # Collect null statistics
-            null_percentage = stats.get('null_percentage', 0)
-            total_null_percentage += null_percentage
-            if null_percentage > 0:
-                columns_with_nulls += 1
-            if null_percentage > highest_null_column["percentage"]:
-                highest_null_column = {"name": column_name, "percentage": null_percentage}
-            
-            # Collect uniqueness statistics
-            unique_percentage = stats.get('unique_percentage', 0)
-            total_unique_percentage += unique_percentage
-            if unique_percentage < lowest_unique_column["percentage"] and unique_percentage > 0:
-                lowest_unique_column = {"name": column_name, "percentage": unique_percentage}
+        positive_uniques = np.where(unique_percentages > 0, unique_percentages, np.inf)
+        lowest_idx = positive_uniques.argmin()
+        if positive_uniques[lowest_idx] < 100:
+            lowest_unique_column = {
+                "name": column_names[lowest_idx],
+                "percentage": column_stats[lowest_idx]['unique_percentage']
+            }
         
         # Calculate averages
-        avg_null_percentage = total_null_percentage / total_columns if total_columns > 0 else 0
-        avg_unique_percentage = total_unique_percentage / total_columns if total_columns > 0 else 0
+        avg_null_percentage = float(total_null_percentage / total_columns)
+        avg_unique_percentage = float(total_unique_percentage / total_columns)
         
         # Format the summary
         summary = {
@@ -100,25 +139,39 @@ class SummaryStatistics:
         """
         logger.info("Calculating dataset health score")
 
+        # Nothing to score, e.g. when probing a table without any columns
+        if not analysis_results and not rule_results:
+            return {
+                "health_score": 0.0,
+                "health_status": "Unknown",
+                "components": {
+                    "rule_compliance": 0,
+                    "completeness": 0
+                },
+                "column_scores": {}
+            }
+
         # Calculate summary statistics
         summary = self.calculate_summary(analysis_results)
         
-        # Calculate rule pass rates
-        total_rules = 0
-        passed_rules = 0
-        rule_scores = {}
-        
-        for column_name, column_rules in rule_results.items():
-            column_total = len(column_rules)
-            column_passed = sum(1 for r in column_rules if r['result'].get('passed', False))
-            
-            total_rules += column_total
-            passed_rules += column_passed
-            
-            # Store column score
-            if column_total > 0:
-                column_score = round(column_passed / column_total * 100, 2)
-                rule_scores[column_name] = column_score
+        # Calculate rule pass rates, rounding all column scores in one call
+        column_names = list(rule_results)
+        totals = np.fromiter(
+            (len(column_rules) for column_rules in rule_results.values()),
+            dtype=np.int64, count=len(column_names)
+        )
+        passed = np.fromiter(
+            (sum(1 for r in column_rules if _get_result(r).get('passed'))
+             for column_rules in rule_results.values()),
+            dtype=np.int64, count=len(column_names)
+        )
+        total_rules = int(totals.sum())
+        passed_rules = int(passed.sum())
+
+        # Store column scores for columns with at least one rule
+        scored = np.flatnonzero(totals > 0)
+        column_scores = np.round(passed[scored] / totals[scored] * 100, 2)
+        rule_scores = dict(zip((column_names[idx] for idx in scored), column_scores.tolist()))
         
         # Calculate overall rule compliance
         rule_compliance = round(passed_rules / total_rules * 100, 2) if total_rules > 0 else 0
@@ -150,6 +203,6 @@ class SummaryStatistics:
             "column_scores": rule_scores
         }
         
-        logger.info(f"Health score calculation complete: {health_score} ({health_status})")
+        logger.info("Health score calculation complete: %s (%s)", health_score, health_status)
         return health_report
 
@@ -8,6 +8,9 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Column type prefixes treated as numeric by the outlier and skewness checks
+NUMERIC_TYPE_PREFIXES = ('int', 'float')
+
 class TrendDetector:
     """
     Detects trends and anomolies in dataset statistics.
@@ -25,61 +28,9 @@ class TrendDetector:
         """
         logger.info("Detecting outliers in dataset")
         
-        outliers = {}
-
-        for column_name, column_data in analysis_results.items():
-            column_type = column_data.get('type', 'unknown')
-            stats = column_data.get('stats', {})
-            
-            # Only check numeric columns
-            if not (column_type.startswith('int') or column_type.startswith('float')):
-                continue
-            
-            # Check if we have the necessary statistics
-            if 'mean' not in stats or 'std_dev' not in stats:
-                continue
-            
-            mean = stats['mean']
-            std_dev = stats['std_dev']
-            min_val = stats.get('min')
-            max_val = stats.get('max')
-            
-            # Skip if std_dev is too small (to avoid division by near-zero)
-            if std_dev < 1e-10:
-                continue
-            
-            # Calculate z-scores for min and max
-            if min_val is not None:
-                min_z_score = abs((min_val - mean) / std_dev)
-            else:
-                min_z_score = 0
-                
-            if max_val is not None:
-                max_z_score = abs((max_val - mean) / std_dev)
-            else:
-                max_z_score = 0
-            
-            # Check for potential outliers (z-score > 3)
-            column_outliers = []
-            
-            if min_z_score > 3:
-                column_outliers.append({
-                    "value": min_val,
-                    "z_score": round(min_z_score, 2),
-                    "type": "minimum"
-                })
-            
-            if max_z_score > 3:
-                column_outliers.append({
-                    "value": max_val,
-                    "z_score": round(max_z_score, 2),
-                    "type": "maximum"
-                })
-            
-            if column_outliers:
-                outliers[column_name] = column_outliers
+        outliers, _ = self._scan_numeric_columns(analysis_results)
         
-        logger.info(f"Found outliers in {len(outliers)} columns")
+        logger.info("Found outliers in %d columns", len(outliers))
         return outliers
     
     def detect_distribution_skewness(self, analysis_results):
@@ -92,52 +43,104 @@ class TrendDetector:
         Returns:    
             Dictionary of skewness information by column
         """
-        skewness_info = {}
-        
+        _, skewness_info = self._scan_numeric_columns(analysis_results)
+        return skewness_info
+
+    def _scan_numeric_columns(self, analysis_results):
+        """
+        Run the outlier and skewness checks over all numeric columns at once.
+
+        The statistics are gathered into NumPy arrays and checked with
+        vectorised operations; only the flagged columns are turned back into
+        dictionaries.
+
+        Args:
+            analysis_results: Dictionary of column analysis results
+
+        Returns:
+            Tuple of (outliers, skewness_info) dictionaries by column
+        """
+        column_names = []
+        column_stats = []
         for column_name, column_data in analysis_results.items():
             column_type = column_data.get('type', 'unknown')
-            stats = column_data.get('stats', {})
-            
             # Only check numeric columns
-            if not (column_type.startswith('int') or column_type.startswith('float')):
-                continue
-            
-            # Check if we have the necessary statistics
-            if 'mean' not in stats or 'median' not in stats:
-                continue
-            
-            mean = stats['mean']
-            median = stats['median']
-            
-            # Calculate simple skewness estimate
-            # If mean > median, distribution is right-skewed (positive skewness)
-            # If mean < median, distribution is left-skewed (negative skewness)
-            if abs(mean - median) < 1e-10:
-                skew_direction = "symmetric"
-                skew_strength = "none"
+            if column_type.startswith(NUMERIC_TYPE_PREFIXES):
+                column_names.append(column_name)
+                column_stats.append(column_data.get('stats', {}))
+
+        def gather(key):
+            # Missing statistics become NaN, which never pass the checks below
+            return np.fromiter(
+                (np.nan if stats.get(key) is None else stats[key] for stats in column_stats),
+                dtype=np.float64, count=len(column_stats)
+            )
+
+        means = gather('mean')
+        medians = gather('median')
+        std_devs = gather('std_dev')
+        mins = gather('min')
+        maxs = gather('max')
+        has_skew_stats = np.fromiter(
+            ('mean' in stats and 'median' in stats for stats in column_stats),
+            dtype=bool, count=len(column_stats)
+        )
+
+        # Calculate z-scores for min and max and the mean/median differences
+        with np.errstate(divide='ignore', invalid='ignore'):
+            min_z_scores = np.abs((mins - means) / std_devs)
+            max_z_scores = np.abs((maxs - means) / std_devs)
+            # Skip near-zero std_dev to avoid division by near-zero
+            usable_std = std_devs >= 1e-10
+            min_outliers = usable_std & (min_z_scores > 3)
+            max_outliers = usable_std & (max_z_scores > 3)
+
+            differences = np.abs(means - medians)
+            skewed = has_skew_stats & ~(differences < 1e-10)
+            scale = np.maximum(np.maximum(np.abs(means), np.abs(medians)), 1e-10)
+            diff_percentages = differences / scale * 100
+
+        # Check for potential outliers (z-score > 3)
+        outliers = {}
+        for idx in np.flatnonzero(min_outliers | max_outliers):
+            stats = column_stats[idx]
+            column_outliers = []
+            if min_outliers[idx]:
+                column_outliers.append({
+                    "value": stats['min'],
+                    "z_score": round(float(min_z_scores[idx]), 2),
+                    "type": "minimum"
+                })
+            if max_outliers[idx]:
+                column_outliers.append({
+                    "value": stats['max'],
+                    "z_score": round(float(max_z_scores[idx]), 2),
+                    "type": "maximum"
+                })
+            outliers[column_names[idx]] = column_outliers
+
+        # If mean > median, distribution is right-skewed (positive skewness)
+        # If mean < median, distribution is left-skewed (negative skewness)
+        skewness_info = {}
+        for idx in np.flatnonzero(skewed):
+            stats = column_stats[idx]
+            diff_percentage = float(diff_percentages[idx])
+            if diff_percentage < 5:
+                skew_strength = "mild"
+            elif diff_percentage < 15:
+                skew_strength = "moderate"
             else:
-                skew_direction = "right-skewed" if mean > median else "left-skewed"
-                
-                # Estimate skew strength by difference between mean and median
-                diff_percentage = abs(mean - median) / max(abs(mean), abs(median), 1e-10) * 100
-                
-                if diff_percentage < 5:
-                    skew_strength = "mild"
-                elif diff_percentage < 15:
-                    skew_strength = "moderate"
-                else:
-                    skew_strength = "strong"
-            
-            if skew_direction != "symmetric":
-                skewness_info[column_name] = {
-                    "direction": skew_direction,
-                    "strength": skew_strength,
-                    "mean": mean,
-                    "median": median,
-                    "difference_percentage": round(diff_percentage, 2) if 'diff_percentage' in locals() else 0
-                }
-        
-        return skewness_info
+                skew_strength = "strong"
+
+            skewness_info[column_names[idx]] = {
+                "direction": "right-skewed" if means[idx] > medians[idx] else "left-skewed",
+                "strength": skew_strength,
+                "mean": stats['mean'],
+                "median": stats['median'],
+                "difference_percentage": round(diff_percentage, 2)
+            }
+
+        return outliers, skewness_info
     
     def get_data_insights(self, analysis_results):
         """
@@ -151,30 +154,25 @@ class TrendDetector:
         """
         logger.info("Generating data insights")
         
-        # Detect outliers
-        outliers = self.detect_outliers(analysis_results)
-        
-        # Detect skewness
-        skewness = self.detect_distribution_skewness(analysis_results)
-        
-        # Identify columns with high null percentages
+        outliers, skewness = self._scan_numeric_columns(analysis_results)
         high_null_columns = {}
+        low_unique_columns = {}
+
+        # Collect the null and uniqueness checks in a single pass
         for column_name, column_data in analysis_results.items():
             stats = column_data.get('stats', {})
+
+            # Identify columns with high null percentages
             null_percentage = stats.get('null_percentage', 0)
-            
             if null_percentage > 10:  # Consider > 10% nulls as high
                 high_null_columns[column_name] = null_percentage
-        
-        # Identify columns with low uniqueness
-        low_unique_columns = {}
-        for column_name, column_data in analysis_results.items():
-            stats = column_data.get('stats', {})
+
+            # Identify columns with low uniqueness (only with at least 100 rows)
             unique_percentage = stats.get('unique_percentage', 0)
-            
-            # Only consider columns with at least 100 rows
             if stats.get('count', 0) >= 100 and unique_percentage < 1:
                 low_unique_columns[column_name] = unique_percentage
+
+        logger.info("Found outliers in %d columns", len(outliers))
         
         # Compile insights
         insights = {
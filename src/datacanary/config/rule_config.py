@@ -7,12 +7,26 @@ import json
 import yaml
 import logging
 
+# Prefer the libyaml-backed loader and orjson when they are available
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from datacanary.rules.rule_engine import (
     Rule, NullPercentageRule, UniqueValueRule, ValueRangeRule, PatternMatchRule, RuleEngine
 )
 
 logger = logging.getLogger(__name__)
 
+# Parsed rules by file path, stored with the (mtime, size) they were read at
+_RULE_CACHE = {}
+
 def load_rules_from_file(file_path):
     """
     Load rule definitions from a YAML or JSON file.
@@ -25,6 +39,16 @@ def load_rules_from_file(file_path):
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Rule configuration file not found: {file_path}")
+
+    # Reuse the parsed rules while the file is unchanged. Rules hold no
+    # evaluation state, so the instances can be shared between callers.
+    file_stat = os.stat(file_path)
+    cache_path = os.path.abspath(file_path)
+    file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _RULE_CACHE.get(cache_path)
+    if cached is not None and cached[0] == file_version:
+        logger.debug("Using cached rules for %s", file_path)
+        return list(cached[1])
     
     # Determine file type based on extension
     file_ext = os.path.splitext(file_path)[1].lower()
@@ -32,10 +56,14 @@ def load_rules_from_file(file_path):
     try:
         if file_ext == '.yaml' or file_ext == '.yml':
             with open(file_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_SafeLoader)
         elif file_ext == '.json':
-            with open(file_path, 'r') as f:
-                config = json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r') as f:
+                    config = json.load(f)
         else:
             raise ValueError(f"Unsupported file extension: {file_ext}. Use .yaml, .yml, or .json")
     
@@ -48,13 +76,39 @@ def load_rules_from_file(file_path):
             if rule:
                 rules.append(rule)
             
-        logger.info(f"Loaded {len(rules)} rules from {file_path}")
-        return rules
+        logger.info("Loaded %d rules from %s", len(rules), file_path)
+        _RULE_CACHE[cache_path] = (file_version, rules)
+        return list(rules)
         
     except Exception as e:
-        logger.error(f"Error loading rules from {file_path}: {e}")
+        logger.error("Error loading rules from %s: %s", file_path, e)
         raise
 
+def _create_pattern_match_rule(rule_config):
+    """Create a PatternMatchRule, or None if no pattern is configured."""
+    pattern = rule_config.get('pattern')
+    if not pattern:
+        logger.warning("Pattern match rule missing 'pattern' key, skipping")
+        return None
+    name = rule_config.get('name')
+    description = rule_config.get('description')
+    return PatternMatchRule(pattern=pattern, name=name, description=description)
+
+# Rule constructors by configuration type
+_RULE_FACTORIES = {
+    'null_percentage': lambda rule_config: NullPercentageRule(
+        threshold=rule_config.get('threshold', 5.0)
+    ),
+    'unique_value': lambda rule_config: UniqueValueRule(
+        threshold=rule_config.get('threshold', 90.0)
+    ),
+    'value_range': lambda rule_config: ValueRangeRule(
+        min_value=rule_config.get('min_value'),
+        max_value=rule_config.get('max_value')
+    ),
+    'pattern_match': _create_pattern_match_rule,
+}
+
 def create_rule_from_config(rule_config):
     """
     Create a Rule Instance from a config dictionary.
@@ -71,35 +125,15 @@ def create_rule_from_config(rule_config):
     
     rule_type = rule_config['type']
 
-    try:
-        if rule_type == 'null_percentage':
-            threshold = rule_config.get('threshold', 5.0)
-            return NullPercentageRule(threshold=threshold)
-        
-        elif rule_type == 'unique_value':
-            threshold = rule_config.get('threshold', 90.0)
-            return UniqueValueRule(threshold=threshold)
-        
-        elif rule_type == 'value_range':
-            min_value = rule_config.get('min_value')
-            max_value = rule_config.get('max_value')
-            return ValueRangeRule(min_value=min_value, max_value=max_value)
-
-        elif rule_type == 'pattern_match':
-            pattern = rule_config.get('pattern')
-            if not pattern:
-                logger.warning("Pattern match rule missing 'pattern' key, skipping")
-                return None
-            name = rule_config.get('name')
-            description = rule_config.get('description')
-            return PatternMatchRule(pattern=pattern, name=name, description=description)
+    factory = _RULE_FACTORIES.get(rule_type)
+    if factory is None:
+        logger.warning("Unknown rule type: %s", rule_type)
+        return None
 
-        else:
-            logger.warning(f"Unknown rule type: {rule_type}")
-            return None
-    
+    try:
+        return factory(rule_config)
     except Exception as e:
-        logger.error(f"Error creating rule of type {rule_type}: {e}")
+        logger.error("Error creating rule of type %s: %s", rule_type, e)
         return None
     
 def apply_rules_to_engine(rule_engine, file_path):
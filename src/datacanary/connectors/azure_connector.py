@@ -3,19 +3,26 @@ Connector for Azure Blob Storage data sources.
 """
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from azure.storage.blob import BlobServiceClient, BlobClient
 from azure.core.exceptions import ResourceNotFoundError, AzureError
 
 logger = logging.getLogger(__name__)
 
+# Number of parallel range requests used to download a blob
+DEFAULT_MAX_CONCURRENCY = 16
+
 class AzureConnector():
     """
     Connects to Azure Blob Storage to retrieve data files.
     """
 
-    def __init__(self, connection_string=None, account_url=None, account_key=None, credential=None):
+    def __init__(self, connection_string=None, account_url=None, account_key=None, credential=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY):
         """
         Initialise the Azure Blob Storage connector. 
 
@@ -24,7 +31,12 @@ class AzureConnector():
             account_url: Optional Azure Storage account URL 
             account_key: Optional Azure Storage account key
             credential: Optional credential object for authentication
+            max_concurrency: Maximum number of parallel range requests per download
         """
+        self.max_concurrency = max_concurrency
+        # Container clients by name, reused across calls
+        self._container_clients = {}
+
         # Try different authentication methods
         if connection_string:
             logger.info("Initializing AzureConnector with connection string")
@@ -63,16 +75,34 @@ class AzureConnector():
                     else:
                         raise ValueError("No valid authentication method provided and environment variables not set")
             except Exception as e:
-                logger.error(f"Error initializing with environment variables: {e}")
+                logger.error("Error initializing with environment variables: %s", e)
                 raise
 
-    def read_parquet(self, container_name, blob_name):
+    def _container(self, container_name):
+        """
+        Get the client for a container, creating it on first use.
+
+        Args:
+            container_name: Azure Storage container name
+
+        Returns:
+            ContainerClient for the container
+        """
+        container_client = self._container_clients.get(container_name)
+        if container_client is None:
+            container_client = self.service_client.get_container_client(container_name)
+            self._container_clients[container_name] = container_client
+        return container_client
+
+    def read_parquet(self, container_name, blob_name, columns=None, filters=None):
         """
         Read a Parquet file from Azure Blob Storage into a Pandas DataFrame.
 
         Args:
             container_name: Azure Storage container name (equivelant to S3 bucket)
             blob_name: Blob name (path to the file)
+            columns: Optional list of columns to read
+            filters: Optional row filters, in the pyarrow filters format
 
         Returns:
             DataFrame containing the Parquet file
@@ -82,29 +112,61 @@ class AzureConnector():
             raise ValueError("Container name and blob name must be provided")
         
         storage_path = f"azure://{container_name}/{blob_name}"
-        logger.info(f"Reading Parquet file from {storage_path}")
+        logger.info("Reading Parquet file from %s", storage_path)
 
         try:
             # Get a client to the blob
-            container_client = self.service_client.get_container_client(container_name)
+            container_client = self._container(container_name)
             blob_client = container_client.get_blob_client(blob_name)
             
-            # Download the blob
-            download_stream = blob_client.download_blob()
-            blob_data = download_stream.readall()
+            # Download the blob, fetching its chunks in parallel
+            download_stream = blob_client.download_blob(max_concurrency=self.max_concurrency)
+            sink = BytesIO()
+            download_stream.readinto(sink)
             
-            # Read the Parquet file from the downloaded data
-            return pd.read_parquet(BytesIO(blob_data))
+            # Read the Parquet file straight from the download buffer, without copying it
+            table = pq.read_table(pa.py_buffer(sink.getbuffer()), columns=columns, filters=filters)
+            return table.to_pandas()
         except ResourceNotFoundError as e:
-            logger.error(f"Blob not found: {storage_path}, Error: {e}")
+            logger.error("Blob not found: %s, Error: %s", storage_path, e)
             raise
         except AzureError as e:
-            logger.error(f"Azure service error accessing {storage_path}: {e}")
+            logger.error("Azure service error accessing %s: %s", storage_path, e)
             raise
         except Exception as e:
-            logger.error(f"Error reading Parquet file from {storage_path}: {e}")
+            logger.error("Error reading Parquet file from %s: %s", storage_path, e)
             raise
 
+    def read_parquet_prefix(self, container_name, prefix="", columns=None, filters=None, max_workers=None):
+        """
+        Read every Parquet file under a prefix into a single Pandas DataFrame.
+
+        The files are downloaded concurrently through the shared service
+        client, so they reuse its connection pool.
+
+        Args:
+            container_name: Azure Storage container name
+            prefix: Optional prefix to filter blobs
+            columns: Optional list of columns to read
+            filters: Optional row filters, in the pyarrow filters format
+            max_workers: Optional maximum number of files read in parallel
+
+        Returns:
+            DataFrame with the rows of all the Parquet files, in listing order
+        """
+        blob_names = self.list_parquet_files(container_name, prefix)
+        if not blob_names:
+            logger.warning("No Parquet files found in azure://%s/%s", container_name, prefix)
+            return pd.DataFrame()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(
+                lambda blob_name: self.read_parquet(container_name, blob_name, columns, filters),
+                blob_names
+            ))
+
+        return pd.concat(frames, ignore_index=True)
+
     def list_parquet_files(self, container_name, prefix=""):
         """
         List all Parquet files in a container within a given prefix
@@ -116,11 +178,11 @@ class AzureConnector():
         Returns:  
             List of blob names for Parquet files 
         """
-        logger.info(f"Listing Parquet files in azure://{container_name}/{prefix}")
+        logger.info("Listing Parquet files in azure://%s/%s", container_name, prefix)
 
         try:
             # Get a client to the container
-            container_client = self.service_client.get_container_client(container_name)
+            container_client = self._container(container_name)
             
             # List all blobs with the given prefix
             blobs = container_client.list_blobs(name_starts_with=prefix)
@@ -128,16 +190,16 @@ class AzureConnector():
             # Filter for Parquet files
             parquet_files = [blob.name for blob in blobs if blob.name.endswith('.parquet')]
             
-            logger.info(f"Found {len(parquet_files)} Parquet files")
+            logger.info("Found %d Parquet files", len(parquet_files))
             return parquet_files
         except ResourceNotFoundError as e:
-            logger.error(f"Container not found: {container_name}, Error: {e}")
+            logger.error("Container not found: %s, Error: %s", container_name, e)
             raise
         except AzureError as e:
-            logger.error(f"Azure service error listing blobs: {e}")
+            logger.error("Azure service error listing blobs: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error listing Parquet files: {e}")
+            logger.error("Error listing Parquet files: %s", e)
             raise
 
     def get_object_metadata(self, container_name, blob_name):
@@ -151,11 +213,11 @@ class AzureConnector():
         Returns:
             Dictionary of object metadata
         """
-        logger.info(f"Getting metadata for azure://{container_name}/{blob_name}")
+        logger.info("Getting metadata for azure://%s/%s", container_name, blob_name)
 
         try:
             # Get a client to the blob
-            container_client = self.service_client.get_container_client(container_name)
+            container_client = self._container(container_name)
             blob_client = container_client.get_blob_client(blob_name)
             
             # Get blob properties
@@ -168,12 +230,31 @@ class AzureConnector():
                 'metadata': properties.metadata
             }
         except ResourceNotFoundError as e:
-            logger.error(f"Blob not found: {container_name}/{blob_name}, Error: {e}")
+            logger.error("Blob not found: %s/%s, Error: %s", container_name, blob_name, e)
             raise
         except AzureError as e:
-            logger.error(f"Azure service error accessing metadata: {e}")
+            logger.error("Azure service error accessing metadata: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error getting metadata for {container_name}/{blob_name}: {e}")
+            logger.error("Error getting metadata for %s/%s: %s", container_name, blob_name, e)
             raise
 
+    def get_many_object_metadata(self, container_name, blob_names, max_workers=16):
+        """
+        Get metadata for several blobs, fetching them concurrently.
+
+        Args:
+            container_name: Azure Storage container name
+            blob_names: Iterable of blob names
+            max_workers: Maximum number of metadata requests in flight
+
+        Returns:
+            Dictionary mapping each blob name to its object metadata
+        """
+        blob_names = list(blob_names)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            metadata = executor.map(
+                lambda blob_name: self.get_object_metadata(container_name, blob_name),
+                blob_names
+            )
+            return dict(zip(blob_names, metadata))
@@ -0,0 +1,52 @@
+"""
+Loaders for the default credential files used by the CLI.
+"""
+import csv
+import functools
+import json
+
+
+@functools.lru_cache(maxsize=4)
+def load_s3_credentials(path):
+    """
+    Read an AWS access key pair from a credentials CSV file.
+
+    The file has a header row followed by a row whose first two fields
+    are the access key ID and the secret access key. Results are cached
+    per path, so repeated lookups in one process only read the file once.
+
+    Args:
+        path: Path to the credentials CSV file
+
+    Returns:
+        Tuple of (access_key_id, secret_access_key), or None if the file
+        contains no credentials row
+    """
+    with open(path, 'r', newline='') as f:
+        csv_reader = csv.reader(f)
+        # Skip header row
+        next(csv_reader, None)
+        for row in csv_reader:
+            if len(row) >= 2:
+                return row[0], row[1]
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def load_azure_credentials(path):
+    """
+    Read Azure Storage credentials from a JSON file.
+
+    Results are cached per path, so repeated lookups in one process only
+    read the file once.
+
+    Args:
+        path: Path to the credentials JSON file
+
+    Returns:
+        Tuple of (connection_string, account_url, account_key); missing
+        entries are None
+    """
+    with open(path, 'r') as f:
+        creds = json.load(f)
+    return creds.get('connection_string'), creds.get('account_url'), creds.get('account_key')
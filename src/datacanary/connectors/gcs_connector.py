@@ -3,27 +3,43 @@ Connector for Google Cloud Storage data sources.
 """
 import logging
 import os
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import storage
 from google.auth.exceptions import DefaultCredentialsError
 
 logger = logging.getLogger(__name__)
 
+# Glob matching every Parquet object name, used to filter listings server-side
+PARQUET_GLOB = "**.parquet"
+
+# Objects larger than one chunk are downloaded as ranged reads issued in parallel
+DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
 class GCSConnector:
     """
     Connects to Google Cloud Storage to retrieve data files. 
     """
 
-    def __init__(self, credentials_path = None, project_id = None):
+    def __init__(self, credentials_path = None, project_id = None, chunk_size=DOWNLOAD_CHUNK_SIZE,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY):
         """
         Initialise the Google Cloud Connector.
 
         Args:
             credentials_path: Optional path to service account JSON key file
             project_id: Optional Google Cloud project id
+            chunk_size: Size in bytes of each ranged read for large objects
+            max_concurrency: Maximum number of ranged reads issued in parallel
         """
-        logger.info(f"Initializing GCSConnector with credentials_path: {credentials_path}, project_id: {project_id}")
+        logger.info("Initializing GCSConnector with credentials_path: %s, project_id: %s", credentials_path, project_id)
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        # Bucket handles by name, reused across calls
+        self._buckets = {}
 
         # Set environment variable for credentials if provided
         if credentials_path:
@@ -34,22 +50,40 @@ class GCSConnector:
             self.client = storage.Client(project=project_id)
             if project_id is None:
                 project_id = self.client.project
-            logger.info(f"Successfully connected to GCS with project: {project_id}")
+            logger.info("Successfully connected to GCS with project: %s", project_id)
         except DefaultCredentialsError as e:
-            logger.error(f"Error initializing GCS client: {e}")
+            logger.error("Error initializing GCS client: %s", e)
             logger.error("Make sure you have provided valid credentials or are running in an environment with default credentials")
             raise
         except Exception as e:
-            logger.error(f"Error initializing GCS client: {e}")
+            logger.error("Error initializing GCS client: %s", e)
             raise
 
-    def read_parquet(self, bucket_name, blob_name):
+    def _bucket(self, bucket_name):
+        """
+        Get the handle for a bucket, creating it on first use.
+
+        Args:
+            bucket_name: GCS bucket_name
+
+        Returns:
+            Bucket handle
+        """
+        bucket = self._buckets.get(bucket_name)
+        if bucket is None:
+            bucket = self.client.bucket(bucket_name)
+            self._buckets[bucket_name] = bucket
+        return bucket
+
+    def read_parquet(self, bucket_name, blob_name, columns=None, filters=None):
         """
         Read a Parquet file from Google Cloud Storage into a Pandas DataFrame.
 
         Args:
             bucket_name: GCS bucket_name
             blob_name: GCS blob_name
+            columns: Optional list of columns to read
+            filters: Optional row filters, in the pyarrow filters format
 
         Returns:
             DataFrame containing the Parquet file data
@@ -59,22 +93,104 @@ class GCSConnector:
             raise ValueError("Bucket name and blob name must be provided")
             
         gcs_path = f"gs://{bucket_name}/{blob_name}"
-        logger.info(f"Reading Parquet file from {gcs_path}")
+        logger.info("Reading Parquet file from %s", gcs_path)
 
         try:
             # Get a reference to the bucket and blob
-            bucket = self.client.bucket(bucket_name)
+            bucket = self._bucket(bucket_name)
             blob = bucket.blob(blob_name)
             
             # Download the blob content to memory
-            content = blob.download_as_bytes()
+            content = self._download(blob)
             
-            # Read the Parquet file from the downloaded content
-            return pd.read_parquet(BytesIO(content))
+            # Read the Parquet file straight from the downloaded bytes, without copying them
+            table = pq.read_table(pa.py_buffer(content), columns=columns, filters=filters)
+            return table.to_pandas()
         except Exception as e:
-            logger.error(f"Error reading Parquet file from {gcs_path}: {e}")
+            logger.error("Error reading Parquet file from %s: %s", gcs_path, e)
             raise
 
+    def _download(self, blob):
+        """
+        Download a blob, using concurrent ranged reads for large objects.
+
+        The first chunk is fetched on its own, so objects that fit in one
+        chunk cost a single request. The remaining chunks are pinned to the
+        generation returned with the first one, so an object overwritten
+        mid-download fails instead of being stitched from two versions.
+
+        Args:
+            blob: GCS blob handle
+
+        Returns:
+            bytes or bytearray with the blob contents
+
+        Raises:
+            IOError: If a ranged read returns fewer bytes than requested
+        """
+        if blob.size is not None and blob.size <= self.chunk_size:
+            return blob.download_as_bytes()
+
+        first = blob.download_as_bytes(start=0, end=self.chunk_size - 1,
+                                       if_generation_match=blob.generation)
+        if len(first) < self.chunk_size:
+            return first
+
+        # The ranged read records the object generation, but not its size
+        generation = blob.generation
+        if blob.size is None:
+            blob.reload(if_generation_match=generation)
+        size = blob.size
+
+        data = bytearray(size)
+        data[:len(first)] = first
+
+        def fetch(start):
+            end = min(start + self.chunk_size, size) - 1
+            part = blob.download_as_bytes(start=start, end=end, if_generation_match=generation)
+            if len(part) != end - start + 1:
+                raise IOError(
+                    f"Short read of gs://{blob.bucket.name}/{blob.name}: expected "
+                    f"{end - start + 1} bytes at offset {start}, got {len(part)}"
+                )
+            data[start:end + 1] = part
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # list() re-raises the first failed request
+            list(executor.map(fetch, range(self.chunk_size, size, self.chunk_size)))
+
+        return data
+
+    def read_parquet_prefix(self, bucket_name, prefix="", columns=None, filters=None, max_workers=None):
+        """
+        Read every Parquet file under a prefix into a single Pandas DataFrame.
+
+        The files are downloaded concurrently through the shared storage
+        client, so they reuse its connection pool.
+
+        Args:
+            bucket_name: GCS bucket_name
+            prefix: Optional prefix to filter objects
+            columns: Optional list of columns to read
+            filters: Optional row filters, in the pyarrow filters format
+            max_workers: Optional maximum number of files read in parallel
+
+        Returns:
+            DataFrame with the rows of all the Parquet files, in listing order
+        """
+        blob_names = self.list_parquet_files(bucket_name, prefix)
+        if not blob_names:
+            logger.warning("No Parquet files found in gs://%s/%s", bucket_name, prefix)
+            return pd.DataFrame()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(
+                lambda blob_name: self.read_parquet(bucket_name, blob_name, columns, filters),
+                blob_names
+            ))
+
+        return pd.concat(frames, ignore_index=True)
+
     def list_parquet_files(self, bucket_name, prefix=""):
         """
         List all Parquet files in a GCS bucket with the given prefix.
@@ -86,22 +202,54 @@ class GCSConnector:
         Returns:
             List of blob names for Parquet files
         """
-        logger.info(f"Listing Parquet files in gs://{bucket_name}/{prefix}")
+        logger.info("Listing Parquet files in gs://%s/%s", bucket_name, prefix)
 
         try:
             # Get a reference to the bucket
-            bucket = self.client.bucket(bucket_name)
+            bucket = self._bucket(bucket_name)
             
-            # List all blobs with the given prefix
-            blobs = bucket.list_blobs(prefix=prefix)
+            # List the Parquet blobs with the given prefix, filtered server-side
+            blobs = bucket.list_blobs(prefix=prefix, match_glob=PARQUET_GLOB)
             
-            # Filter for Parquet files
+            # The suffix check is kept for servers that ignore match_glob
             parquet_files = [blob.name for blob in blobs if blob.name.endswith('.parquet')]
             
-            logger.info(f"Found {len(parquet_files)} Parquet files")
+            logger.info("Found %d Parquet files", len(parquet_files))
             return parquet_files
         except Exception as e:
-            logger.error(f"Error listing Parquet files: {e}")
+            logger.error("Error listing Parquet files: %s", e)
+            raise
+
+    def objects_exist(self, bucket_name, blob_names):
+        """
+        Check which of several blobs exist with a single listing.
+
+        Instead of one metadata request per blob, the blobs under the
+        longest common prefix of the names are listed, fetching only their
+        names.
+
+        Args:
+            bucket_name: GCS bucket_name
+            blob_names: Iterable of blob names
+
+        Returns:
+            Dictionary mapping each blob name to True if it exists
+        """
+        blob_names = list(blob_names)
+        if not blob_names:
+            return {}
+
+        common_prefix = os.path.commonprefix(blob_names)
+        logger.info("Checking %d blobs under gs://%s/%s", len(blob_names), bucket_name, common_prefix)
+
+        try:
+            blobs = self._bucket(bucket_name).list_blobs(
+                prefix=common_prefix, fields="items(name),nextPageToken"
+            )
+            present = {blob.name for blob in blobs}
+            return {blob_name: blob_name in present for blob_name in blob_names}
+        except Exception as e:
+            logger.error("Error checking blobs in gs://%s/%s: %s", bucket_name, common_prefix, e)
             raise
 
     def get_object_metadata(self, bucket_name, blob_name):
@@ -115,11 +263,11 @@ class GCSConnector:
         Returns:
             Dictionary of object metadata
         """
-        logger.info(f"Getting metadata for gs://{bucket_name}/{blob_name}")
+        logger.info("Getting metadata for gs://%s/%s", bucket_name, blob_name)
 
         try:
             # Get a reference to the bucket and blob
-            bucket = self.client.bucket(bucket_name)
+            bucket = self._bucket(bucket_name)
             blob = bucket.blob(blob_name)
             
             # Get blob metadata
@@ -132,5 +280,25 @@ class GCSConnector:
                 'metadata': blob.metadata or {}
             }
         except Exception as e:
-            logger.error(f"Error getting metadata for gs://{bucket_name}/{blob_name}: {e}")
-            raise
\ No newline at end of file
+            logger.error("Error getting metadata for gs://%s/%s: %s", bucket_name, blob_name, e)
+            raise
+
+    def get_many_object_metadata(self, bucket_name, blob_names, max_workers=16):
+        """
+        Get metadata for several blobs, fetching them concurrently.
+
+        Args:
+            bucket_name: GCS bucket_name
+            blob_names: Iterable of blob names
+            max_workers: Maximum number of metadata requests in flight
+
+        Returns:
+            Dictionary mapping each blob name to its object metadata
+        """
+        blob_names = list(blob_names)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            metadata = executor.map(
+                lambda blob_name: self.get_object_metadata(bucket_name, blob_name),
+                blob_names
+            )
+            return dict(zip(blob_names, metadata))
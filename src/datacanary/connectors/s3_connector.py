@@ -1,34 +1,187 @@
+import functools
+import io
 import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import boto3
-import pandas as pd 
+from botocore.config import Config
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
+# S3 has a high per-request latency but scales with concurrency, so objects
+# are downloaded as ranged GETs of DEFAULT_BUFFER_SIZE bytes issued in parallel.
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Maximum number of keys accepted by a single DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+_CONTENT_RANGE_RE = re.compile(r'bytes \d+-\d+/(\d+)')
+
+# Keys of the Parquet objects in a ListObjectsV2 page
+_PARQUET_KEYS_EXPRESSION = "Contents[?ends_with(Key, '.parquet')].Key"
+
+# A pool larger than DEFAULT_MAX_CONCURRENCY lets listings and metadata
+# lookups overlap with downloads without waiting for a free connection
+_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# Environment variables that select the default credentials; their values
+# are part of the client cache key so changed credentials get a new client
+_CREDENTIAL_ENV_VARS = (
+    'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN', 'AWS_PROFILE'
+)
+
+# Serialises client creation, so concurrent connectors share one session
+_CLIENT_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=16)
+def _create_client(aws_profile, aws_region, credentials):
+    """
+    Create a boto3 session and S3 client, cached so connectors with the
+    same settings share their connection pools (and TLS sessions).
+
+    Args:
+        aws_profile: AWS profile name, or None for the default credentials
+        aws_region: AWS region, or None for the default region
+        credentials: Values of the credential environment variables, only
+            used as part of the cache key
+
+    Returns:
+        Tuple of (session, client)
+    """
+    session = boto3.Session(
+        profile_name = aws_profile,
+        region_name = aws_region)
+    return session, session.client('s3', config=_CLIENT_CONFIG)
+
+class _S3RangeFile(io.RawIOBase):
+    """
+    Read-only, seekable file over an S3 object, where every read is a ranged GET.
+
+    Lets pyarrow fetch just the Parquet footer and the column chunks it
+    needs instead of the whole object. Reads are pinned to one ETag, so an
+    object replaced while it is being read fails instead of mixing versions.
+    """
+
+    def __init__(self, s3, bucket, key, size, etag):
+        """
+        Initialise the file.
+
+        Args:
+            s3: boto3 S3 client
+            bucket: S3 bucket name
+            key: S3 object key
+            size: Object size in bytes
+            etag: ETag of the object version to read
+        """
+        super().__init__()
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._etag = etag
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer):
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+
+        response = self._s3.get_object(
+            Bucket=self._bucket, Key=self._key,
+            Range=f"bytes={self._position}-{end - 1}", IfMatch=self._etag
+        )
+        data = response['Body'].read()
+        if len(data) != end - self._position:
+            raise IOError(
+                f"Short read of s3://{self._bucket}/{self._key}: expected "
+                f"{end - self._position} bytes at offset {self._position}, got {len(data)}"
+            )
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
 class S3Connector:
     """
     Connects to AWS S3 to retrieve data files 
     """
 
-    def __init__(self, aws_profile=None, aws_region=None):
+    def __init__(self, aws_profile=None, aws_region=None, buffer_size=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY):
         """
         Initialise the S3 Connector.
 
         Args:
             aws_profile: Optional AWS profile name to use for credentials 
+            aws_region: Optional AWS region
+            buffer_size: Optional size in bytes of each ranged read (defaults to 8 MiB)
+            max_concurrency: Maximum number of ranged reads issued in parallel
         """
-        logger.info(f"Initializing S3Connector with profile: {aws_profile}, region: {aws_region}")
-        self.session = boto3.Session(
-            profile_name = aws_profile,
-            region_name = aws_region)
-        self.s3 = self.session.client('s3')
+        logger.info("Initializing S3Connector with profile: %s, region: %s", aws_profile, aws_region)
+        self.buffer_size = buffer_size or DEFAULT_BUFFER_SIZE
+        self.max_concurrency = max_concurrency
+        self.session, self.s3 = self._get_client(aws_profile, aws_region)
 
-    def read_parquet(self, bucket, key):
+    @staticmethod
+    def _get_client(aws_profile, aws_region):
+        """
+        Get the boto3 session and S3 client for a profile and region, creating them on first use.
+
+        Args:
+            aws_profile: AWS profile name, or None for the default credentials
+            aws_region: AWS region, or None for the default region
+
+        Returns:
+            Tuple of (session, client)
+        """
+        credentials = tuple(os.environ.get(name) for name in _CREDENTIAL_ENV_VARS)
+        with _CLIENT_LOCK:
+            return _create_client(aws_profile, aws_region, credentials)
+
+    @staticmethod
+    def clear_client_cache():
+        """
+        Drop the cached sessions and clients, so new connectors pick up changed credentials.
+        """
+        with _CLIENT_LOCK:
+            _create_client.cache_clear()
+
+    def read_parquet(self, bucket, key, columns=None, filters=None):
         """
         Read a Parquet file from S3 into a pandas DataFrame.
 
         Args:
             bucket: S3 bucket name
             key: S3 object key (path to the file)
+            columns: Optional list of columns to read
+            filters: Optional row filters, in the pyarrow filters format
 
         Returns:
             DataFrame containing the Parquet file data 
@@ -42,14 +195,109 @@ class S3Connector:
             raise ValueError('Bucket and Key must be provided')
 
         s3_uri = f"s3://{bucket}/{key}"
-        logger.info(f"Reading Parquet file from {s3_uri}")
+        logger.info("Reading Parquet file from %s", s3_uri)
+
+        try:
+            table = pq.read_table(
+                pa.py_buffer(self._download(bucket, key)),
+                columns=columns, filters=filters, pre_buffer=True
+            )
+            return table.to_pandas()
+        except Exception as e:
+            logger.error("Error reading Parquet file from %s: %s", s3_uri, e)
+            raise
+
+    def read_parquet_columns(self, bucket, key, columns=None, filters=None):
+        """
+        Read selected columns and row groups of a Parquet file from S3.
+
+        Unlike read_parquet, the object is not downloaded in full: only the
+        footer, the requested columns and the row groups that can match the
+        filters are fetched, with ranged GETs.
+
+        Args:
+            bucket: S3 bucket name
+            key: S3 object key (path to the file)
+            columns: Optional list of columns to read
+            filters: Optional row filters, in the pyarrow filters format
+
+        Returns:
+            DataFrame containing the selected Parquet data
+
+        Raises:
+            ValueError: If the bucket or key is invalid
+            Exception: If there's an error reading the file
+        """
+        if not bucket or not key:
+            logger.error("Invalid bucket or key provided")
+            raise ValueError('Bucket and Key must be provided')
+
+        s3_uri = f"s3://{bucket}/{key}"
+        logger.info("Reading columns %s from Parquet file %s", columns, s3_uri)
 
         try:
-            return pd.read_parquet(s3_uri)
+            head = self.s3.head_object(Bucket=bucket, Key=key)
+            # pre_buffer coalesces the column chunk reads into few large ranges,
+            # so each pyarrow read below maps to one GET
+            table = pq.read_table(
+                _S3RangeFile(self.s3, bucket, key, head['ContentLength'], head['ETag']),
+                columns=columns, filters=filters, pre_buffer=True
+            )
+            return table.to_pandas()
         except Exception as e:
-            logger.error(f"Error reading Parquet file from {s3_uri}: {e}")
+            logger.error("Error reading Parquet file from %s: %s", s3_uri, e)
             raise
 
+    def _download(self, bucket, key):
+        """
+        Download an object with concurrent ranged GET requests.
+
+        The first range also returns the object size, so small objects
+        need a single request and no separate HEAD call. The remaining
+        ranges are pinned to the ETag of the first response, so an object
+        replaced mid-download fails instead of being stitched from two versions.
+
+        Args:
+            bucket: S3 bucket name
+            key: S3 object key
+
+        Returns:
+            bytearray with the object contents
+
+        Raises:
+            IOError: If a ranged GET returns fewer bytes than requested
+        """
+        part_size = self.buffer_size
+        response = self.s3.get_object(Bucket=bucket, Key=key, Range=f"bytes=0-{part_size - 1}")
+        first_part = response['Body'].read()
+
+        match = _CONTENT_RANGE_RE.match(response.get('ContentRange', ''))
+        size = int(match.group(1)) if match else len(first_part)
+        if size <= len(first_part):
+            return bytearray(first_part)
+
+        etag = response['ETag']
+        data = bytearray(size)
+        data[:len(first_part)] = first_part
+
+        def fetch(start):
+            end = min(start + part_size, size) - 1
+            part = self.s3.get_object(
+                Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag
+            )['Body'].read()
+            if len(part) != end - start + 1:
+                raise IOError(
+                    f"Short read of s3://{bucket}/{key}: expected {end - start + 1} bytes "
+                    f"at offset {start}, got {len(part)}"
+                )
+            data[start:end + 1] = part
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # list() re-raises the first failed request
+            list(executor.map(fetch, range(len(first_part), size, part_size)))
+
+        return data
+
     def list_parquet_files(self, bucket, prefix=""):
         """
         List all parquet files in a bucket with the given prefix. 
@@ -61,21 +309,18 @@ class S3Connector:
         Returns:
             List of S3 keys for Parquet files. 
         """
-        logger.info(f"Listing Parquet files in s3://{bucket}/{prefix}")
+        logger.info("Listing Parquet files in s3://%s/%s", bucket, prefix)
 
-        result = []
         paginator = self.s3.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000}
+        )
 
-        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-            if 'Contents' not in page:
-                continue
-
-            for obj in page['Contents']:
-                key = obj['Key']
-                if key.endswith('.parquet'):
-                    result.append(key)
+        # Filter each page inside botocore with a JMESPath expression; pages without
+        # any objects yield None
+        result = [key for key in pages.search(_PARQUET_KEYS_EXPRESSION) if key is not None]
 
-        logger.info(f"Found {len(result)} Parquet files")
+        logger.info("Found %d Parquet files", len(result))
         return result
     
     def get_object_metadata(self, bucket, key):
@@ -89,7 +334,7 @@ class S3Connector:
         Returns:
             Dictionary of object metadata
         """
-        logger.info(f"Getting metadata for s3://{bucket}/{key}")
+        logger.info("Getting metadata for s3://%s/%s", bucket, key)
 
         try:
             response = self.s3.head_object(Bucket=bucket, Key=key)
@@ -100,5 +345,55 @@ class S3Connector:
                 'metadata': response.get('Metadata', {})
             }
         except Exception as e:
-            logger.error(f"Error getting metadata for s3://{bucket}/{key}: {e}")
-            raise
\ No newline at end of file
+            logger.error("Error getting metadata for s3://%s/%s: %s", bucket, key, e)
+            raise
+
+    def get_many_object_metadata(self, bucket, keys, max_workers=16):
+        """
+        Get metadata for several S3 objects, issuing the HEAD requests concurrently.
+
+        Args:
+            bucket: S3 bucket name
+            keys: Iterable of S3 object keys
+            max_workers: Maximum number of HEAD requests in flight
+
+        Returns:
+            Dictionary mapping each key to its object metadata
+        """
+        keys = list(keys)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            metadata = executor.map(lambda key: self.get_object_metadata(bucket, key), keys)
+            return dict(zip(keys, metadata))
+
+    def delete_objects(self, bucket, keys):
+        """
+        Delete several S3 objects using batched DeleteObjects requests.
+
+        Keys are sent in batches of up to 1000, and the batches are
+        submitted concurrently.
+
+        Args:
+            bucket: S3 bucket name
+            keys: Iterable of S3 object keys
+
+        Returns:
+            Dictionary mapping each key to True if it was deleted
+        """
+        keys = list(keys)
+        logger.info("Deleting %d objects from s3://%s", len(keys), bucket)
+
+        def delete_batch(batch):
+            response = self.s3.delete_objects(
+                Bucket=bucket,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+            )
+            # Quiet mode only reports the keys that failed
+            for error in response.get('Errors', []):
+                logger.error("Error deleting s3://%s/%s: %s", bucket, error['Key'], error.get('Message'))
+            return {error['Key'] for error in response.get('Errors', [])}
+
+        batches = [keys[i:i + DELETE_BATCH_SIZE] for i in range(0, len(keys), DELETE_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            failed = set().union(*executor.map(delete_batch, batches))
+
+        return {key: key not in failed for key in keys}
@@ -2,13 +2,47 @@
 Report generation module for DataCanary.
 Formats analysis and rule results into readable reports.
 """
+import functools
+import io
 import logging
 import os
+import shutil
 from datetime import datetime
 import re
 
+from datacanary.analysis.summary_statistics import SummaryStatistics
+from datacanary.analysis.trend_detection import TrendDetector
+from datacanary.utils.serialization import dumps_json
+
 logger = logging.getLogger(__name__)
 
+# Characters that are not suitable for filenames
+_SANITIZE_RE = re.compile(r'[^\w\-_]')
+
+# Timestamp formats for report filenames and report contents
+_FILENAME_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+_REPORT_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Buffer size for reports streamed straight to disk
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Reports are always saved next to this module
+_REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
+
+@functools.lru_cache(maxsize=None)
+def _ensure_directory(path):
+    """
+    Create a directory if it doesn't exist, once per process.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        str: The directory path
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
+
 class ReportGenerator:
     """
     Generates formatted reports from analysis and rule evaluation results.
@@ -18,21 +52,19 @@ class ReportGenerator:
         """
         Initialise the report generator
         """
-        # Use the fixed directory path
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.reports_dir = os.path.join(current_dir, "reports")
-        
-        # Ensure the reports directory exists
-        if not os.path.exists(self.reports_dir):
-            os.makedirs(self.reports_dir)
-            logger.info(f"Created reports directory: {self.reports_dir}")
+        self._summary = SummaryStatistics()
+        self._trends = TrendDetector()
 
-    def _get_report_filename(self, dataset_name):
+        # Use the fixed directory path, created by the first generator
+        self.reports_dir = _ensure_directory(_REPORTS_DIR)
+
+    def _get_report_filename(self, dataset_name, extension="txt"):
         """
         Generate a standardized filename for a report.
         
         Args:
             dataset_name: Name or identifier of the dataset
+            extension: File extension of the report
             
         Returns:
             str: Standardised filename
@@ -42,85 +74,166 @@ class ReportGenerator:
         # Remove extension if present
         file_name = os.path.splitext(file_name)[0]
         # Clean up the filename (remove any characters that aren't suitable for filenames)
-        file_name = re.sub(r'[^\w\-_]', '_', file_name)
+        file_name = _SANITIZE_RE.sub('_', file_name)
         # Current date and time in a filename-friendly format
-        date_str = datetime.now().strftime('%Y%m%d_%H%M%S')
+        date_str = datetime.now().strftime(_FILENAME_TIMESTAMP_FORMAT)
         
-        return f"datacanary_report_{file_name}_{date_str}.txt"
+        return f"datacanary_report_{file_name}_{date_str}.{extension}"
     
-    def generate_text_report(self, dataset_name, analysis_results, rule_results, output_path=None):
+    def _write_report_file(self, path, mode, write):
         """
-        Generate a text report of data quality results.
-        
+        Write a report file, removing it again if writing fails part-way.
+
+        Args:
+            path: Path of the report file
+            mode: File mode, 'w' for text or 'wb' for binary reports
+            write: Callable that writes the report to the open file
+
+        Returns:
+            bool: True if the report was saved
+        """
+        try:
+            f = open(path, mode, buffering=_WRITE_BUFFER_SIZE)
+        except Exception as e:
+            logger.error("Error saving report to %s: %s", path, e)
+            return False
+
+        try:
+            with f:
+                write(f)
+        except Exception as e:
+            logger.error("Error saving report to %s: %s", path, e)
+            # Don't leave a truncated report behind
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return False
+
+        logger.info("Report saved to: %s", path)
+        return True
+
+    def _save_report_with(self, write, mode, default_path, output_path=None):
+        """
+        Save a report to the default path and, optionally, a custom path.
+
+        Args:
+            write: Callable that writes the report to an open file
+            mode: File mode, 'w' for text or 'wb' for binary reports
+            default_path: Path in the reports directory
+            output_path: Optional custom path to save the report
+
+        Returns:
+            str: Path of the first saved copy, or None if it could not be saved
+        """
+        # Save to the default path once
+        saved_path = default_path if self._write_report_file(default_path, mode, write) else None
+
+        # If custom output path provided, copy the saved file there instead
+        # of serialising the report again (copyfile uses sendfile on Linux)
+        if output_path and os.path.abspath(output_path) != os.path.abspath(default_path):
+            if saved_path is None:
+                if self._write_report_file(output_path, mode, write):
+                    saved_path = output_path
+            else:
+                try:
+                    shutil.copyfile(default_path, output_path)
+                    logger.info("Report saved to: %s", output_path)
+                except Exception as e:
+                    logger.error("Error saving report to %s: %s", output_path, e)
+
+        return saved_path
+
+    def _save_report(self, content, default_path, output_path=None):
+        """
+        Save report contents to the default path and, optionally, a custom path.
+
+        Args:
+            content: Report contents, str for text or bytes for binary files
+            default_path: Path in the reports directory
+            output_path: Optional custom path to save the report
+
+        Returns:
+            str: Path of the first saved copy, or None if it could not be saved
+        """
+        mode = 'wb' if isinstance(content, bytes) else 'w'
+        return self._save_report_with(lambda f: f.write(content), mode, default_path, output_path)
+
+    def _write_text_report(self, report, dataset_name, analysis_results, rule_results):
+        """
+        Write a text report of data quality results to a text stream.
+
         Args:
+            report: Writable text stream, e.g. an io.StringIO or an open file
             dataset_name: Name or identifier of the dataset
             analysis_results: Dictionary of analysis results from StatisticalAnalyzer
             rule_results: Dictionary of rule evaluation results from RuleEngine
-            output_path: Optional custom path to save the report
-            
-        Returns:
-            str: Formatted report text
         """
-        logger.info(f"Generating text report for dataset: {dataset_name}")
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = datetime.now().strftime(_REPORT_TIMESTAMP_FORMAT)
         
         # Generate summary statistics and insights
-        from datacanary.analysis.summary_statistics import SummaryStatistics
-        from datacanary.analysis.trend_detection import TrendDetector
-
-        summary_stats = SummaryStatistics().calculate_summary(analysis_results)
-        health_score = SummaryStatistics().get_health_score(analysis_results, rule_results)
-        insights = TrendDetector().get_data_insights(analysis_results)
-
-        report = [
-            f"= DataCanary Quality Report =",
-            f"Dataset: {dataset_name}",
-            f"Generated: {now}",
-            f"Total columns: {len(analysis_results)}",
-            f"Health Score: {health_score['health_score']} ({health_score['health_status']})",
-            ""
-        ]
+        summary_stats = self._summary.calculate_summary(analysis_results)
+        health_score = self._summary.get_health_score(analysis_results, rule_results)
+        insights = self._trends.get_data_insights(analysis_results)
+
+        w = report.write
+        w("= DataCanary Quality Report =\n")
+        w(f"Dataset: {dataset_name}\n")
+        w(f"Generated: {now}\n")
+        w(f"Total columns: {len(analysis_results)}\n")
+        w(f"Health Score: {health_score['health_score']} ({health_score['health_status']})\n")
+        w("\n")
 
         # Add dataset summary section
-        report.append("== Dataset Summary ==")
+        w("== Dataset Summary ==\n")
         dataset_stats = summary_stats['dataset_statistics']
-        report.append(f"Total columns: {dataset_stats['total_columns']}")
+        w(f"Total columns: {dataset_stats['total_columns']}\n")
 
         # Format column types
         column_types_str = ", ".join([f"{type}: {count}" for type, count in dataset_stats['column_types'].items()])
-        report.append(f"Column types: {column_types_str}")
+        w(f"Column types: {column_types_str}\n")
 
-        report.append(f"Columns with nulls: {dataset_stats['columns_with_nulls']} ({dataset_stats['columns_with_nulls_percentage']}%)")
-        report.append(f"Average null percentage: {dataset_stats['avg_null_percentage']}%")
-        report.append(f"Average unique percentage: {dataset_stats['avg_unique_percentage']}%")
-        report.append("")
+        w(f"Columns with nulls: {dataset_stats['columns_with_nulls']} ({dataset_stats['columns_with_nulls_percentage']}%)\n")
+        w(f"Average null percentage: {dataset_stats['avg_null_percentage']}%\n")
+        w(f"Average unique percentage: {dataset_stats['avg_unique_percentage']}%\n")
+        w("\n")
 
         # Add data insights section
         if insights['summary']:
-            report.append("== Data Insights ==")
+            w("== Data Insights ==\n")
             for insight in insights['summary']:
-                report.append(f"- {insight}")
-            report.append("")
+                w(f"- {insight}\n")
+            w("\n")
 
         # Add recommendations section
         if insights['recommendations']:
-            report.append("== Recommendations ==")
+            w("== Recommendations ==\n")
             for recommendation in insights['recommendations']:
-                report.append(f"- {recommendation}")
-            report.append("")
+                w(f"- {recommendation}\n")
+            w("\n")
 
         # Overall statistics
         total_rules = 0
         passed_rules = 0
         
-        # Process each column
+        # Process each column, sharing one empty dict for missing entries
+        empty = {}
         for column_name, column_rules in rule_results.items():
             # Get column statistics
-            column_stats = analysis_results.get(column_name, {}).get('stats', {})
-            column_type = analysis_results.get(column_name, {}).get('type', 'unknown')
+            column_info = analysis_results.get(column_name, empty)
+            column_stats = column_info.get('stats', empty)
+            column_type = column_info.get('type', 'unknown')
             
-            # Count passed and failed rules
-            column_passed = sum(1 for r in column_rules if r['result'].get('passed', False))
+            # Count passed rules and format the rule results in one pass
+            column_passed = 0
+            rule_lines = []
+            for rule in column_rules:
+                rule_result = rule['result']
+                passed = rule_result.get('passed', False)
+                if passed:
+                    column_passed += 1
+                message = rule_result.get('message', 'No details')
+                rule_lines.append(f"  [{'✓' if passed else '✗'}] {rule['rule_name']}: {message}\n")
             column_total = len(column_rules)
             
             total_rules += column_total
@@ -128,55 +241,125 @@ class ReportGenerator:
             
             # Add column section
             status = "✓" if column_passed == column_total else "✗"
-            report.append(f"== Column: {column_name} [{status}] ==")
-            report.append(f"Type: {column_type}")
-            report.append(f"Rules: {column_passed}/{column_total} passed")
+            w(
+                f"== Column: {column_name} [{status}] ==\n"
+                f"Type: {column_type}\n"
+                f"Rules: {column_passed}/{column_total} passed\n"
+                "Statistics:\n"
+            )
             
             # Add statistics
-            report.append("Statistics:")
-            for stat_name, stat_value in column_stats.items():
-                report.append(f"  {stat_name}: {stat_value}")
+            report.writelines([f"  {stat_name}: {stat_value}\n" for stat_name, stat_value in column_stats.items()])
             
             # Add rule results
-            report.append("Rule Results:")
-            for rule in column_rules:
-                rule_name = rule['rule_name']
-                rule_desc = rule['description']
-                rule_result = rule['result']
-                passed = rule_result.get('passed', False)
-                message = rule_result.get('message', 'No details')
-                
-                status = "✓" if passed else "✗"
-                report.append(f"  [{status}] {rule_name}: {message}")
+            w("Rule Results:\n")
+            report.writelines(rule_lines)
             
-            report.append("")
+            w("\n")
         
         # Add summary
         pass_rate = (passed_rules / total_rules * 100) if total_rules > 0 else 0
-        report.append(f"== Summary ==")
-        report.append(f"Total rules evaluated: {total_rules}")
-        report.append(f"Rules passed: {passed_rules} ({pass_rate:.1f}%)")
-        report.append(f"Overall status: {'PASSED' if pass_rate == 100 else 'FAILED'}")
-        
-        # Convert to string
-        report_text = "\n".join(report)
+        w("== Summary ==\n")
+        w(f"Total rules evaluated: {total_rules}\n")
+        w(f"Rules passed: {passed_rules} ({pass_rate:.1f}%)\n")
+        w(f"Overall status: {'PASSED' if pass_rate == 100 else 'FAILED'}")
+
+    def generate_text_report(self, dataset_name, analysis_results, rule_results, output_path=None):
+        """
+        Generate a text report of data quality results.
         
+        Args:
+            dataset_name: Name or identifier of the dataset
+            analysis_results: Dictionary of analysis results from StatisticalAnalyzer
+            rule_results: Dictionary of rule evaluation results from RuleEngine
+            output_path: Optional custom path to save the report
+            
+        Returns:
+            str: Formatted report text
+        """
+        logger.info("Generating text report for dataset: %s", dataset_name)
+
+        # Write the report into a single buffer
+        report = io.StringIO()
+        self._write_text_report(report, dataset_name, analysis_results, rule_results)
+        report_text = report.getvalue()
+
         # Save the report (always save to the fixed directory)
         filename = self._get_report_filename(dataset_name)
         default_path = os.path.join(self.reports_dir, filename)
-        
-        # If custom output path provided, use it as well
-        save_paths = [default_path]
-        if output_path:
-            save_paths.append(output_path)
-        
-        # Save to all paths
-        for path in save_paths:
-            try:
-                with open(path, 'w') as f:
-                    f.write(report_text)
-                logger.info(f"Report saved to: {path}")
-            except Exception as e:
-                logger.error(f"Error saving report to {path}: {e}")
-        
-        return report_text
\ No newline at end of file
+        self._save_report(report_text, default_path, output_path)
+
+        return report_text
+
+    def write_text_report(self, dataset_name, analysis_results, rule_results, output_path=None):
+        """
+        Write a text report of data quality results straight to disk.
+
+        Unlike generate_text_report, the report is streamed to the file
+        instead of being built in memory.
+
+        Args:
+            dataset_name: Name or identifier of the dataset
+            analysis_results: Dictionary of analysis results from StatisticalAnalyzer
+            rule_results: Dictionary of rule evaluation results from RuleEngine
+            output_path: Optional custom path to save the report
+
+        Returns:
+            str: Path of the saved report, or None if it could not be saved
+        """
+        logger.info("Writing text report for dataset: %s", dataset_name)
+
+        filename = self._get_report_filename(dataset_name)
+        default_path = os.path.join(self.reports_dir, filename)
+        return self._save_report_with(
+            lambda f: self._write_text_report(f, dataset_name, analysis_results, rule_results),
+            'w', default_path, output_path
+        )
+
+    def generate_json_report(self, dataset_name, analysis_results, rule_results, output_path=None):
+        """
+        Generate a JSON report of data quality results.
+
+        Contains the same data as the text report, serialised directly
+        instead of formatted line by line.
+
+        Args:
+            dataset_name: Name or identifier of the dataset
+            analysis_results: Dictionary of analysis results from StatisticalAnalyzer
+            rule_results: Dictionary of rule evaluation results from RuleEngine
+            output_path: Optional custom path to save the report
+
+        Returns:
+            dict: The report contents
+        """
+        logger.info("Generating JSON report for dataset: %s", dataset_name)
+
+        columns = {
+            column_name: {
+                'type': column_data.get('type', 'unknown'),
+                'stats': column_data.get('stats', {}),
+                'rules': rule_results.get(column_name, [])
+            }
+            for column_name, column_data in analysis_results.items()
+        }
+        # Columns with rules but without analysis results
+        for column_name, column_rules in rule_results.items():
+            if column_name not in columns:
+                columns[column_name] = {'type': 'unknown', 'stats': {}, 'rules': column_rules}
+
+        report = {
+            'dataset': dataset_name,
+            'generated': datetime.now().strftime(_REPORT_TIMESTAMP_FORMAT),
+            'health': self._summary.get_health_score(analysis_results, rule_results),
+            'summary': self._summary.calculate_summary(analysis_results),
+            'insights': self._trends.get_data_insights(analysis_results),
+            'columns': columns
+        }
+
+        payload = dumps_json(report)
+
+        filename = self._get_report_filename(dataset_name, extension="json")
+        default_path = os.path.join(self.reports_dir, filename)
+        self._save_report(payload, default_path, output_path)
+
+        return report
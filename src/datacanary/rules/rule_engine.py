@@ -11,6 +11,8 @@ class Rule:
     """
     Base class for data quality rules.
     """
+    __slots__ = ('name', 'description', 'applicable_types')
+
     def __init__(self, name, description, applicable_types):
         """
         Initialise a rule.
@@ -40,11 +42,10 @@ class Rule:
         if 'type' not in column_stats:
             return False
         
-        col_type = column_stats['type']
-
-        for applicable_type in self.applicable_types:
-            if isinstance(applicable_type, str) and col_type.startswith(applicable_type):
-                return True
+        # A single startswith call over all the type prefixes
+        return column_stats['type'].startswith(tuple(
+            applicable_type for applicable_type in self.applicable_types if isinstance(applicable_type, str)
+        ))
 
     def evaluate(self, column_stats):
         """
@@ -65,6 +66,8 @@ class NullPercentageRule(Rule):
     """
     Rule to check if null percentage is below a threshold.
     """
+    __slots__ = ('threshold', '_msg_tail')
+
     def __init__(self, threshold=5.0):
         """
         Initialise the rule.
@@ -78,6 +81,8 @@ class NullPercentageRule(Rule):
             applicable_types=None  # Applies to all column types
         )
         self.threshold = threshold
+        # The threshold part of the message is the same for every evaluation
+        self._msg_tail = f"% nulls (threshold: {threshold}%)"
 
     def evaluate(self, column_stats):
         """
@@ -90,7 +95,7 @@ class NullPercentageRule(Rule):
             dict: Evaluation result
         """
         if 'stats' not in column_stats or 'null_percentage' not in column_stats['stats']:
-            logger.warning(f"Cannot evaluate {self.name}: required statistics not found")
+            logger.warning("Cannot evaluate %s: required statistics not found", self.name)
             return {
                 "passed": False,
                 "reason": "Required statistics not available",
@@ -104,13 +109,15 @@ class NullPercentageRule(Rule):
             "passed": passed,
             "actual": null_pct,
             "threshold": self.threshold,
-            "message": f"Column has {null_pct:.2f}% nulls (threshold: {self.threshold}%)"
+            "message": f"Column has {null_pct:.2f}" + self._msg_tail
         }
     
 class UniqueValueRule(Rule):
     """
     Rule to check if a column has a minimum percentage of unique values.
     """
+    __slots__ = ('threshold', '_msg_tail')
+
     def __init__(self, threshold = 90.0):
         """
         Initialise the rule. 
@@ -124,6 +131,8 @@ class UniqueValueRule(Rule):
             applicable_types=None  # Applies to all column types
         )
         self.threshold = threshold
+        # The threshold part of the message is the same for every evaluation
+        self._msg_tail = f"% unique values (threshold: {threshold}%)"
 
     def evaluate(self, column_stats):
         """
@@ -136,7 +145,7 @@ class UniqueValueRule(Rule):
             dict: Evaluation result
         """
         if 'stats' not in column_stats or 'unique_percentage' not in column_stats['stats']:
-            logger.warning(f"Cannot evaluate {self.name}: required statistics not found")
+            logger.warning("Cannot evaluate %s: required statistics not found", self.name)
             return {
                 "passed": False,
                 "reason": "Required statistics not available",
@@ -150,13 +159,15 @@ class UniqueValueRule(Rule):
             "passed": passed,
             "actual": unique_pct,
             "threshold": self.threshold,
-            "message": f"Column has {unique_pct:.2f}% unique values (threshold: {self.threshold}%)"
+            "message": f"Column has {unique_pct:.2f}" + self._msg_tail
         }
     
 class ValueRangeRule(Rule):
     """
     Rule to check if numeric values are within a specified range.
     """
+    __slots__ = ('min_value', 'max_value', '_check', '_msg_format')
+
     def __init__(self, min_value=None, max_value=None):
         """
         Initialise the rule.
@@ -180,7 +191,39 @@ class ValueRangeRule(Rule):
         )
         self.min_value = min_value
         self.max_value = max_value
+        # Which bounds are set never changes, so pick the check and the
+        # message format once instead of testing for None on every evaluation
+        if min_value is not None and max_value is not None:
+            self._check = self._check_both
+            message_format = "Values range from {0} to {1}", f" (expected: {min_value} to {max_value})"
+        elif min_value is not None:
+            self._check = self._check_min
+            message_format = "Minimum value is {0}", f" (expected at least {min_value})"
+        elif max_value is not None:
+            self._check = self._check_max
+            message_format = "Maximum value is {1}", f" (expected at most {max_value})"
+        else:
+            self._check = self._check_none
+            message_format = "Values range from {0} to {1}", ""
+        head, tail = message_format
+        self._msg_format = head + tail.replace("{", "{{").replace("}", "}}")
     
+    def _check_both(self, min_val, max_val):
+        """Check both the minimum and maximum bounds."""
+        return min_val >= self.min_value and max_val <= self.max_value
+
+    def _check_min(self, min_val, max_val):
+        """Check the minimum bound only."""
+        return min_val >= self.min_value
+
+    def _check_max(self, min_val, max_val):
+        """Check the maximum bound only."""
+        return max_val <= self.max_value
+
+    def _check_none(self, min_val, max_val):
+        """No bounds set, so any range passes."""
+        return True
+
     def evaluate(self, column_stats):
         """
         Evaluate if values are within specified ran.
@@ -193,7 +236,7 @@ class ValueRangeRule(Rule):
         """
         # Check if required stats are available
         if 'stats' not in column_stats or 'min' not in column_stats['stats'] or 'max' not in column_stats['stats']:
-            logger.warning(f"Cannot evaluate {self.name}: required statistics not found")
+            logger.warning("Cannot evaluate %s: required statistics not found", self.name)
             return {
                 "passed": False,
                 "reason": "Required statistics not available",
@@ -203,27 +246,9 @@ class ValueRangeRule(Rule):
         min_val = column_stats['stats']['min']
         max_val = column_stats['stats']['max']
         
-        # Check minimum value if specified
-        min_check = True
-        if self.min_value is not None:
-            min_check = min_val >= self.min_value
-        
-        # Check maximum value if specified
-        max_check = True
-        if self.max_value is not None:
-            max_check = max_val <= self.max_value
-        
-        passed = min_check and max_check
-        
-        # Create appropriate message
-        if self.min_value is not None and self.max_value is not None:
-            message = f"Values range from {min_val} to {max_val} (expected: {self.min_value} to {self.max_value})"
-        elif self.min_value is not None:
-            message = f"Minimum value is {min_val} (expected at least {self.min_value})"
-        elif self.max_value is not None:
-            message = f"Maximum value is {max_val} (expected at most {self.max_value})"
-        else:
-            message = f"Values range from {min_val} to {max_val}"
+        # Check the values against the bounds that are set
+        passed = self._check(min_val, max_val)
+        message = self._msg_format.format(min_val, max_val)
         
         return {
             "passed": passed,
@@ -238,6 +263,8 @@ class PatternMatchRule(Rule):
     """
     Rule to check if string values match a specified pattern.
     """
+    __slots__ = ('pattern', 'compiled_pattern')
+
     def __init__(self, pattern, name=None, description=None):
         """
         Initialise the Rule.
@@ -259,7 +286,7 @@ class PatternMatchRule(Rule):
         try:
             self.compiled_pattern = re.compile(pattern)
         except re.error:
-            logger.error(f"Invalid regular expression pattern: {pattern}")
+            logger.error("Invalid regular expression pattern: %s", pattern)
             self.compiled_pattern = None
 
     def evaluate(self, column_stats):
@@ -281,7 +308,7 @@ class PatternMatchRule(Rule):
             
         # Check if we have sample values to test
         if 'stats' not in column_stats or 'sample_values' not in column_stats['stats']:
-            logger.warning(f"Cannot evaluate {self.name}: no sample values available")
+            logger.warning("Cannot evaluate %s: no sample values available", self.name)
             return {
                 "passed": False,
                 "reason": "Required statistics not available",
@@ -315,6 +342,18 @@ class PatternMatchRule(Rule):
             "message": message
         }
     
+def _has_custom_applicability(rule):
+    """
+    Check whether a rule overrides Rule.is_applicable.
+
+    Args:
+        rule: Rule instance
+
+    Returns:
+        bool: True if the rule's applicability may depend on more than the column type
+    """
+    return type(rule).is_applicable is not Rule.is_applicable
+
 class RuleEngine:
     """
     Engine for managing and evaluating data quality issues.
@@ -323,6 +362,8 @@ class RuleEngine:
     def __init__(self):
         """Initialise an empty rule engine."""
         self.rules = []
+        # Applicable rules by column type, rebuilt when rules are added
+        self._rules_by_type = {}
         logger.info('Initialised RuleEngine')
 
     def add_rule(self, rule):
@@ -333,8 +374,42 @@ class RuleEngine:
             rule: Rule instance to add
         """
         self.rules.append(rule)
-        logger.info(f"Added rule: {rule.name} - {rule.description}")
+        self._rules_by_type.clear()
+        logger.debug("Added rule: %s - %s", rule.name, rule.description)
     
+    def _applicable_rules(self, column_stats):
+        """
+        Get the rules applicable to a column, computed once per column type.
+
+        The base Rule.is_applicable only looks at the column type, so its
+        result is cached by type. Rules that override is_applicable may look
+        at other statistics and are checked again for every column.
+
+        Args:
+            column_stats: Dictionary of statistics for the column
+
+        Returns:
+            list: Rules applicable to the column, in the order they were added
+        """
+        col_type = column_stats.get('type')
+        cached = self._rules_by_type.get(col_type)
+        if cached is None:
+            rules = []
+            has_custom_checks = False
+            for rule in self.rules:
+                if _has_custom_applicability(rule):
+                    rules.append(rule)
+                    has_custom_checks = True
+                elif rule.is_applicable(column_stats):
+                    rules.append(rule)
+            cached = self._rules_by_type[col_type] = (rules, has_custom_checks)
+
+        rules, has_custom_checks = cached
+        if has_custom_checks:
+            rules = [rule for rule in rules
+                     if not _has_custom_applicability(rule) or rule.is_applicable(column_stats)]
+        return rules
+
     def evaluate_column(self, column_name, column_stats):
         """
         Evaluate all rules for a specific column.
@@ -346,14 +421,19 @@ class RuleEngine:
         Returns:
             list: List of evaluation results for each rule
         """
-        logger.info(f"Evaluating {len(self.rules)} rules for column: {column_name}")
+        logger.debug("Evaluating %d rules for column: %s", len(self.rules), column_name)
         results = []
+        passed_count = 0
         
-        for rule in self.rules:
-            if not rule.is_applicable(column_stats):
-                logger.info(f"Skipping rule {rule.name} - not applicable to column {column_name} of type {column_stats.get('type', 'unknown')}")
-                continue
+        applicable_rules = self._applicable_rules(column_stats)
+        skipped_count = len(self.rules) - len(applicable_rules)
+        if skipped_count:
+            logger.debug("Skipping %d rules not applicable to column %s of type %s",
+                         skipped_count, column_name, column_stats.get('type', 'unknown'))
+        if not applicable_rules:
+            return results
 
+        for rule in applicable_rules:
             try:
                 result = rule.evaluate(column_stats)
                 results.append({
@@ -362,11 +442,15 @@ class RuleEngine:
                     "result": result
                 })
                 
-                status = "PASSED" if result.get("passed", False) else "FAILED"
-                logger.debug(f"Rule {rule.name} {status} for column {column_name}")
+                if result.get("passed", False):
+                    passed_count += 1
+                    status = "PASSED"
+                else:
+                    status = "FAILED"
+                logger.debug("Rule %s %s for column %s", rule.name, status, column_name)
                 
             except Exception as e:
-                logger.error(f"Error evaluating rule {rule.name} for column {column_name}: {e}")
+                logger.error("Error evaluating rule %s for column %s: %s", rule.name, column_name, e)
                 results.append({
                     "rule_name": rule.name,
                     "description": rule.description,
@@ -377,11 +461,10 @@ class RuleEngine:
                     }
                 })
         
-        # Count passed and failed rules
-        passed_count = sum(1 for r in results if r['result'].get('passed', False))
+        # Rules that raised are counted as failed
         failed_count = len(results) - passed_count
         
-        logger.info(f"Column {column_name}: {passed_count} rules passed, {failed_count} rules failed")
+        logger.info("Column %s: %d rules passed, %d rules failed", column_name, passed_count, failed_count)
         return results
     
     def evaluate_dataframe(self, analysis_results):
@@ -394,7 +477,7 @@ class RuleEngine:
         Returns:
             dict: Dictionary of evaluation results by column
         """
-        logger.info(f"Evaluating rules for {len(analysis_results)} columns")
+        logger.info("Evaluating rules for %d columns", len(analysis_results))
         results = {}
         
         for column_name, column_stats in analysis_results.items():
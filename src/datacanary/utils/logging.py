@@ -7,6 +7,9 @@ import sys
 def setup_logging(level=None):
     """
     Set up basic logging configuration.
+
+    Log records are written to stderr so that stdout only carries command
+    output and can be piped safely.
     
     Args:
         level: Logging level (defaults to INFO if None)
@@ -18,7 +21,7 @@ def setup_logging(level=None):
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.StreamHandler(sys.stdout)
+            logging.StreamHandler(sys.stderr)
         ]
     )
     
@@ -26,4 +29,4 @@ def setup_logging(level=None):
     logging.getLogger('boto3').setLevel(logging.WARNING)
     logging.getLogger('botocore').setLevel(logging.WARNING)
     
-    logging.info(f"Logging configured with level {logging.getLevelName(level)}")
\ No newline at end of file
+    logging.info("Logging configured with level %s", logging.getLevelName(level))
\ No newline at end of file
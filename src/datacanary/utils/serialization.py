@@ -0,0 +1,61 @@
+"""
+JSON serialisation for DataCanary results and reports.
+"""
+import json
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def json_default(o):
+    """
+    Convert the values found in analysis results that JSON cannot represent.
+
+    Args:
+        o: Value to convert
+
+    Returns:
+        A JSON serialisable equivalent of the value
+    """
+    # Covers pandas Timestamps, which subclass datetime
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+
+    # numpy scalars and arrays
+    if hasattr(o, 'tolist'):
+        return o.tolist()
+
+    return str(o)
+
+def dumps_json(obj):
+    """
+    Serialise an object to indented JSON.
+
+    Uses orjson when it is installed, which serialises numpy scalars natively
+    and is considerably faster than the standard library encoder.
+
+    Args:
+        obj: Object to serialise
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, indent=2, default=json_default).encode('utf-8')
+
+def dump_json(obj, path):
+    """
+    Write an object to a file as indented JSON.
+
+    Args:
+        obj: Object to serialise
+        path: Output file path
+    """
+    with open(path, 'wb') as f:
+        f.write(dumps_json(obj))
@@ -59,25 +59,25 @@ class TestAzureConnector(unittest.TestCase):
         mock_container_client.get_blob_client.return_value = mock_blob_client
         
         # Mock the download_blob result
+        expected_df = pd.DataFrame({'col1': [1, 2], 'col2': ['a', 'b']})
+        parquet_buffer = io.BytesIO()
+        expected_df.to_parquet(parquet_buffer)
         mock_download_stream = MagicMock()
         mock_blob_client.download_blob.return_value = mock_download_stream
-        mock_download_stream.readall.return_value = b'mock_parquet_data'
-        
-        # Mock pandas read_parquet
-        mock_df = pd.DataFrame({'col1': [1, 2], 'col2': ['a', 'b']})
-        with patch('pandas.read_parquet', return_value=mock_df) as mock_read_parquet:
-            # Call the method
-            result = self.connector.read_parquet('test-container', 'test-blob.parquet')
-            
-            # Verify the mocks were called correctly
-            self.connector.service_client.get_container_client.assert_called_once_with('test-container')
-            mock_container_client.get_blob_client.assert_called_once_with('test-blob.parquet')
-            mock_blob_client.download_blob.assert_called_once()
-            mock_download_stream.readall.assert_called_once()
-            
-            # Verify the result
-            self.assertIs(result, mock_df)
-    
+        mock_download_stream.readinto.side_effect = lambda sink: sink.write(parquet_buffer.getvalue())
+        
+        # Call the method
+        result = self.connector.read_parquet('test-container', 'test-blob.parquet')
+        
+        # Verify the mocks were called correctly
+        self.connector.service_client.get_container_client.assert_called_once_with('test-container')
+        mock_container_client.get_blob_client.assert_called_once_with('test-blob.parquet')
+        mock_blob_client.download_blob.assert_called_once()
+        mock_download_stream.readinto.assert_called_once()
+        
+        # Verify the result
+        pd.testing.assert_frame_equal(result, expected_df)
+
     def test_read_parquet_invalid_inputs(self):
         """Test that read_parquet validates its inputs."""
         # Test with empty container
@@ -130,6 +130,27 @@ class TestAzureConnector(unittest.TestCase):
         expected_result = ['file1.parquet', 'folder/file3.parquet']
         self.assertEqual(result, expected_result)
     
+    def test_read_parquet_prefix(self):
+        """Test reading every Parquet file under a prefix into one DataFrame."""
+        frames = {
+            'part-0.parquet': pd.DataFrame({'col1': [1, 2]}),
+            'part-1.parquet': pd.DataFrame({'col1': [3]})
+        }
+
+        with patch.object(self.connector, 'list_parquet_files', return_value=list(frames)), \
+             patch.object(self.connector, 'read_parquet', side_effect=lambda c, b, *args: frames[b]):
+            result = self.connector.read_parquet_prefix('test-container', 'prefix')
+
+        self.assertEqual(result['col1'].tolist(), [1, 2, 3])
+        self.assertEqual(result.index.tolist(), [0, 1, 2])
+
+    def test_read_parquet_prefix_no_files(self):
+        """Test that an empty prefix gives an empty DataFrame."""
+        with patch.object(self.connector, 'list_parquet_files', return_value=[]):
+            result = self.connector.read_parquet_prefix('test-container', 'prefix')
+
+        self.assertTrue(result.empty)
+
     def test_get_object_metadata(self):
         """Test getting metadata for a blob."""
         # Mock the container client and blob client
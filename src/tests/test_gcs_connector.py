@@ -68,22 +68,106 @@ class TestGCSConnector(unittest.TestCase):
         mock_bucket.blob.return_value = mock_blob
         
         # Mock the download_as_bytes result
-        mock_blob.download_as_bytes.return_value = b'mock_parquet_data'
-        
-        # Mock pandas read_parquet
-        mock_df = pd.DataFrame({'col1': [1, 2], 'col2': ['a', 'b']})
-        with patch('pandas.read_parquet', return_value=mock_df) as mock_read_parquet:
-            # Call the method
-            result = self.connector.read_parquet('test-bucket', 'test-blob.parquet')
-            
-            # Verify the mocks were called correctly
-            self.mock_client_instance.bucket.assert_called_once_with('test-bucket')
-            mock_bucket.blob.assert_called_once_with('test-blob.parquet')
-            mock_blob.download_as_bytes.assert_called_once()
-            
-            # Verify the result
-            self.assertIs(result, mock_df)
+        expected_df = pd.DataFrame({'col1': [1, 2], 'col2': ['a', 'b']})
+        parquet_buffer = io.BytesIO()
+        expected_df.to_parquet(parquet_buffer)
+        mock_blob.download_as_bytes.return_value = parquet_buffer.getvalue()
+        mock_blob.size = len(parquet_buffer.getvalue())
+        
+        # Call the method
+        result = self.connector.read_parquet('test-bucket', 'test-blob.parquet')
+        
+        # Verify the mocks were called correctly
+        self.mock_client_instance.bucket.assert_called_once_with('test-bucket')
+        mock_bucket.blob.assert_called_once_with('test-blob.parquet')
+        mock_blob.download_as_bytes.assert_called_once()
+        
+        # Verify the result
+        pd.testing.assert_frame_equal(result, expected_df)
     
+    def test_read_parquet_with_columns(self):
+        """Test that column and row filters are passed to the Parquet reader."""
+        mock_bucket = MagicMock()
+        mock_blob = MagicMock()
+
+        self.mock_client_instance.bucket.return_value = mock_bucket
+        mock_bucket.blob.return_value = mock_blob
+        parquet_buffer = io.BytesIO()
+        pd.DataFrame({'col1': [1, 2, 3], 'col2': ['a', 'b', 'c']}).to_parquet(parquet_buffer)
+        mock_blob.download_as_bytes.return_value = parquet_buffer.getvalue()
+        mock_blob.size = len(parquet_buffer.getvalue())
+
+        result = self.connector.read_parquet(
+            'test-bucket', 'test-blob.parquet', columns=['col1'], filters=[('col1', '>', 1)]
+        )
+
+        self.assertEqual(list(result.columns), ['col1'])
+        self.assertEqual(result['col1'].tolist(), [2, 3])
+
+    def test_read_parquet_large_blob(self):
+        """Test that blobs larger than one chunk are downloaded as ranged reads."""
+        mock_bucket = MagicMock()
+        mock_blob = MagicMock()
+
+        self.mock_client_instance.bucket.return_value = mock_bucket
+        mock_bucket.blob.return_value = mock_blob
+        expected_df = pd.DataFrame({'col1': list(range(1000))})
+        parquet_buffer = io.BytesIO()
+        expected_df.to_parquet(parquet_buffer)
+        content = parquet_buffer.getvalue()
+        mock_blob.size = None
+        mock_blob.generation = 7
+        mock_blob.download_as_bytes.side_effect = lambda start, end, **kwargs: content[start:end + 1]
+
+        def reload(**kwargs):
+            mock_blob.size = len(content)
+        mock_blob.reload.side_effect = reload
+
+        self.connector.chunk_size = 1000
+        result = self.connector.read_parquet('test-bucket', 'test-blob.parquet')
+
+        pd.testing.assert_frame_equal(result, expected_df)
+        self.assertEqual(mock_blob.download_as_bytes.call_count, -(-len(content) // 1000))
+        # Every ranged read is pinned to the generation of the first one
+        mock_blob.reload.assert_called_once_with(if_generation_match=7)
+        for call in mock_blob.download_as_bytes.call_args_list:
+            self.assertEqual(call.kwargs['if_generation_match'], 7)
+
+    def test_read_parquet_small_blob_single_request(self):
+        """Test that a blob of unknown size that fits in one chunk costs one request."""
+        mock_bucket = MagicMock()
+        mock_blob = MagicMock()
+
+        self.mock_client_instance.bucket.return_value = mock_bucket
+        mock_bucket.blob.return_value = mock_blob
+        expected_df = pd.DataFrame({'col1': [1, 2]})
+        parquet_buffer = io.BytesIO()
+        expected_df.to_parquet(parquet_buffer)
+        content = parquet_buffer.getvalue()
+        mock_blob.size = None
+        mock_blob.download_as_bytes.side_effect = lambda start, end, **kwargs: content[start:end + 1]
+
+        result = self.connector.read_parquet('test-bucket', 'test-blob.parquet')
+
+        pd.testing.assert_frame_equal(result, expected_df)
+        mock_blob.download_as_bytes.assert_called_once()
+        mock_blob.reload.assert_not_called()
+
+    def test_read_parquet_short_read(self):
+        """Test that a ranged read returning too few bytes is an error."""
+        mock_bucket = MagicMock()
+        mock_blob = MagicMock()
+
+        self.mock_client_instance.bucket.return_value = mock_bucket
+        mock_bucket.blob.return_value = mock_blob
+        mock_blob.size = 25
+        # Only the first chunk comes back complete
+        mock_blob.download_as_bytes.side_effect = lambda start, end, **kwargs: b'x' * (10 if start == 0 else 3)
+
+        self.connector.chunk_size = 10
+        with self.assertRaises(IOError):
+            self.connector.read_parquet('test-bucket', 'test-blob.parquet')
+
     def test_read_parquet_invalid_inputs(self):
         """Test that read_parquet validates its inputs."""
         # Test with empty bucket
@@ -104,6 +188,7 @@ class TestGCSConnector(unittest.TestCase):
         mock_bucket.blob.return_value = mock_blob
         
         # Mock an error during download
+        mock_blob.size = 1024
         mock_blob.download_as_bytes.side_effect = Exception("Download error")
         
         # Call the method and check that it re-raises the exception
@@ -133,12 +218,47 @@ class TestGCSConnector(unittest.TestCase):
         
         # Verify the method was called correctly
         self.mock_client_instance.bucket.assert_called_once_with('test-bucket')
-        mock_bucket.list_blobs.assert_called_once_with(prefix='prefix')
+        mock_bucket.list_blobs.assert_called_once_with(prefix='prefix', match_glob='**.parquet')
         
         # Verify the result contains only Parquet files
         expected_result = ['file1.parquet', 'folder/file3.parquet']
         self.assertEqual(result, expected_result)
     
+    def test_read_parquet_prefix(self):
+        """Test reading every Parquet file under a prefix into one DataFrame."""
+        frames = {
+            'part-0.parquet': pd.DataFrame({'col1': [1, 2]}),
+            'part-1.parquet': pd.DataFrame({'col1': [3]})
+        }
+
+        with patch.object(self.connector, 'list_parquet_files', return_value=list(frames)), \
+             patch.object(self.connector, 'read_parquet', side_effect=lambda b, n, *args: frames[n]):
+            result = self.connector.read_parquet_prefix('test-bucket', 'prefix', columns=['col1'])
+
+        self.assertEqual(result['col1'].tolist(), [1, 2, 3])
+        self.assertEqual(result.index.tolist(), [0, 1, 2])
+
+    def test_bucket_handle_reused(self):
+        """Test that the bucket handle is created once per bucket."""
+        self.connector.list_parquet_files('test-bucket')
+        self.connector.list_parquet_files('test-bucket', 'prefix')
+
+        self.mock_client_instance.bucket.assert_called_once_with('test-bucket')
+
+    def test_objects_exist(self):
+        """Test checking several blobs with one listing under their common prefix."""
+        mock_blob = MagicMock()
+        mock_blob.name = 'data/a.parquet'
+        mock_bucket = MagicMock()
+        self.mock_client_instance.bucket.return_value = mock_bucket
+        mock_bucket.list_blobs.return_value = [mock_blob]
+
+        result = self.connector.objects_exist('test-bucket', ['data/a.parquet', 'data/b.parquet'])
+
+        mock_bucket.list_blobs.assert_called_once_with(prefix='data/', fields='items(name),nextPageToken')
+        self.assertEqual(result, {'data/a.parquet': True, 'data/b.parquet': False})
+        self.assertEqual(self.connector.objects_exist('test-bucket', []), {})
+
     def test_get_object_metadata(self):
         """Test getting metadata for a blob."""
         # Mock the bucket and blob
@@ -171,5 +291,14 @@ class TestGCSConnector(unittest.TestCase):
         }
         self.assertEqual(result, expected_result)
 
+    def test_get_many_object_metadata(self):
+        """Test getting metadata for several blobs at once."""
+        with patch.object(self.connector, 'get_object_metadata',
+                          side_effect=lambda b, n: {'size_bytes': len(n)}) as mock_metadata:
+            result = self.connector.get_many_object_metadata('test-bucket', iter(['a.parquet', 'bb.parquet']))
+
+        self.assertEqual(result, {'a.parquet': {'size_bytes': 9}, 'bb.parquet': {'size_bytes': 10}})
+        self.assertEqual(mock_metadata.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
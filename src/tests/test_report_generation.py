@@ -1,7 +1,11 @@
 """
 Tests for the report generator.
 """
+import json
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from datacanary.reporting.report_generator import ReportGenerator
 
@@ -61,5 +65,69 @@ class TestReportGenerator(unittest.TestCase):
         self.assertIn('100', report)  # Should indicate 100% pass rate
         self.assertIn('PASSED', report)  # Overall status
 
+    def test_stream_text_report(self):
+        """Test streaming the text report to disk without returning its text."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.reporter.reports_dir = temp_dir
+            output_path = os.path.join(temp_dir, 'report.txt')
+
+            path = self.reporter.write_text_report(
+                'test_dataset',
+                self.analysis_results,
+                self.rule_results,
+                output_path
+            )
+
+            self.assertEqual(os.path.dirname(path), temp_dir)
+            with open(path) as f:
+                saved = f.read()
+            with open(output_path) as f:
+                self.assertEqual(f.read(), saved)
+
+        self.assertIn('test_rule', saved)
+        self.assertTrue(saved.endswith('Overall status: PASSED'))
+
+    def test_write_text_report_fallback(self):
+        """Test that a failed save leaves no partial file and falls back to the custom path."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.reporter.reports_dir = os.path.join(temp_dir, 'missing')
+            output_path = os.path.join(temp_dir, 'report.txt')
+
+            path = self.reporter.write_text_report(
+                'test_dataset', self.analysis_results, self.rule_results, output_path
+            )
+            self.assertEqual(path, output_path)
+
+            # A report that fails part-way is removed again
+            self.reporter.reports_dir = temp_dir
+            with patch.object(self.reporter, '_write_text_report', side_effect=ValueError("boom")):
+                path = self.reporter.write_text_report(
+                    'test_dataset', self.analysis_results, self.rule_results
+                )
+            self.assertIsNone(path)
+            self.assertEqual(os.listdir(temp_dir), ['report.txt'])
+
+    def test_generate_json_report(self):
+        """Test the JSON report generation and saving to a custom path."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.reporter.reports_dir = temp_dir
+            output_path = os.path.join(temp_dir, 'report.json')
+
+            report = self.reporter.generate_json_report(
+                'test_dataset.parquet',
+                self.analysis_results,
+                self.rule_results,
+                output_path
+            )
+
+            with open(output_path) as f:
+                saved = json.load(f)
+            self.assertEqual(len(os.listdir(temp_dir)), 2)
+
+        self.assertEqual(report['dataset'], 'test_dataset.parquet')
+        self.assertEqual(report['health']['components']['rule_compliance'], 100.0)
+        self.assertEqual(saved['columns']['test_column']['rules'][0]['rule_name'], 'test_rule')
+        self.assertEqual(saved['columns']['test_column']['stats']['max'], 100)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
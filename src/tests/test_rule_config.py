@@ -0,0 +1,88 @@
+"""
+Tests for loading rules from configuration files.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+import yaml
+
+from datacanary.config.rule_config import load_rules_from_file, create_rule_from_config
+from datacanary.rules.rule_engine import (
+    NullPercentageRule, UniqueValueRule, ValueRangeRule, PatternMatchRule
+)
+
+class TestRuleConfig(unittest.TestCase):
+    """Test cases for the rule configuration loader."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config = {
+            'rules': [
+                {'type': 'null_percentage', 'threshold': 2.5},
+                {'type': 'unique_value'},
+                {'type': 'value_range', 'min_value': 0, 'max_value': 10},
+                {'type': 'pattern_match', 'pattern': r'^\d+$', 'name': 'digits_only'}
+            ]
+        }
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _write_config(self, filename, content):
+        path = os.path.join(self.temp_dir.name, filename)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_load_yaml_and_json(self):
+        """Test that YAML and JSON files produce the same rules."""
+        yaml_path = self._write_config('rules.yaml', yaml.safe_dump(self.config))
+        json_path = self._write_config('rules.json', json.dumps(self.config))
+
+        for path in (yaml_path, json_path):
+            rules = load_rules_from_file(path)
+            self.assertEqual(
+                [type(rule) for rule in rules],
+                [NullPercentageRule, UniqueValueRule, ValueRangeRule, PatternMatchRule]
+            )
+            self.assertEqual(rules[0].threshold, 2.5)
+            self.assertEqual(rules[1].threshold, 90.0)
+            self.assertEqual(rules[3].name, 'digits_only')
+
+    def test_rules_cached_until_file_changes(self):
+        """Test that an unchanged file is parsed once and a changed one again."""
+        path = self._write_config('rules.json', json.dumps(self.config))
+
+        first = load_rules_from_file(path)
+        second = load_rules_from_file(path)
+        self.assertIsNot(first, second)
+        self.assertIs(first[0], second[0])
+
+        self._write_config('rules.json', json.dumps({'rules': [{'type': 'unique_value'}]}))
+        os.utime(path, ns=(0, 0))
+        reloaded = load_rules_from_file(path)
+        self.assertEqual([type(rule) for rule in reloaded], [UniqueValueRule])
+
+    def test_invalid_files(self):
+        """Test that missing files and unsupported formats are rejected."""
+        with self.assertRaises(FileNotFoundError):
+            load_rules_from_file(os.path.join(self.temp_dir.name, 'missing.yaml'))
+
+        with self.assertRaises(ValueError):
+            load_rules_from_file(self._write_config('rules.txt', ''))
+
+        with self.assertRaises(ValueError):
+            load_rules_from_file(self._write_config('no_rules.json', '{}'))
+
+    def test_create_rule_skips_invalid_configs(self):
+        """Test that unknown or incomplete rule configs are skipped."""
+        self.assertIsNone(create_rule_from_config({'threshold': 5}))
+        self.assertIsNone(create_rule_from_config({'type': 'unknown'}))
+        self.assertIsNone(create_rule_from_config({'type': 'pattern_match'}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,20 @@ class TestRules(unittest.TestCase):
         self.assertFalse(result['passed'])
         self.assertEqual(result['reason'], "Not applicable")
 
+    def test_is_applicable(self):
+        """Test matching column types against the rule's type prefixes."""
+        rule = ValueRangeRule(min_value=0)
+        self.assertIs(rule.is_applicable({'type': 'int64'}), True)
+        self.assertIs(rule.is_applicable({'type': 'float32'}), True)
+        self.assertIs(rule.is_applicable({'type': 'object'}), False)
+        self.assertIs(rule.is_applicable({}), False)
+        self.assertIs(NullPercentageRule().is_applicable({}), True)
+
+        # Changing the applicable types later takes effect
+        rule.applicable_types = ["object"]
+        self.assertIs(rule.is_applicable({'type': 'object'}), True)
+        self.assertIs(rule.is_applicable({'type': 'int64'}), False)
+
 class TestRuleEngine(unittest.TestCase):
     """Test cases for the RuleEngine class."""
     
@@ -155,5 +169,34 @@ class TestRuleEngine(unittest.TestCase):
         self.assertFalse(value_results[0]['result']['passed'])
         self.assertFalse(value_results[1]['result']['passed'])
 
+    def test_rules_added_after_evaluation(self):
+        """Test that rules added after an evaluation apply to later evaluations."""
+        self.engine.evaluate_dataframe(self.analysis_results)
+        self.engine.add_rule(ValueRangeRule(min_value=0, max_value=10))
+
+        results = self.engine.evaluate_column('id_column', self.analysis_results['id_column'])
+        self.assertEqual([r['rule_name'] for r in results],
+                         ['null_percentage_check', 'unique_value_check', 'value_range_check'])
+
+    def test_custom_applicability_checked_per_column(self):
+        """Test that rules overriding is_applicable are checked for every column."""
+        class LargeColumnRule(NullPercentageRule):
+            def is_applicable(self, column_stats):
+                return column_stats['stats'].get('max', 0) > 100
+
+        engine = RuleEngine()
+        engine.add_rule(LargeColumnRule())
+        engine.add_rule(UniqueValueRule(threshold=90.0))
+
+        results = engine.evaluate_dataframe({
+            'small': {'type': 'int64', 'stats': {'max': 10, 'unique_percentage': 100.0}},
+            'large': {'type': 'int64', 'stats': {'max': 1000, 'null_percentage': 0.0,
+                                                 'unique_percentage': 100.0}}
+        })
+
+        self.assertEqual([r['rule_name'] for r in results['small']], ['unique_value_check'])
+        self.assertEqual([r['rule_name'] for r in results['large']],
+                         ['null_percentage_check', 'unique_value_check'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
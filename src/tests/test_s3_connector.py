@@ -0,0 +1,231 @@
+"""
+Tests for the S3 connector.
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import boto3
+import pandas as pd
+from botocore.stub import Stubber
+
+from datacanary.connectors.s3_connector import S3Connector, DELETE_BATCH_SIZE, _S3RangeFile
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client, serving one object."""
+
+    def __init__(self, content, etag='"v1"', honour_range=True):
+        self.content = content
+        self.etag = etag
+        self.honour_range = honour_range
+        self.get_object_calls = []
+
+    def head_object(self, Bucket, Key):
+        return {'ContentLength': len(self.content), 'ETag': self.etag}
+
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None):
+        self.get_object_calls.append({'Range': Range, 'IfMatch': IfMatch})
+        response = {'ETag': self.etag}
+        if Range is None or not self.honour_range:
+            response['Body'] = io.BytesIO(self.content)
+            return response
+
+        start, end = (int(value) for value in Range[len('bytes='):].split('-'))
+        end = min(end, len(self.content) - 1)
+        response['Body'] = io.BytesIO(self.content[start:end + 1])
+        response['ContentRange'] = f"bytes {start}-{end}/{len(self.content)}"
+        return response
+
+class TestS3Connector(unittest.TestCase):
+    """Test cases for the S3Connector class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client_patcher = patch.object(
+            S3Connector, '_get_client', return_value=(MagicMock(), MagicMock())
+        )
+        self.client_patcher.start()
+        self.connector = S3Connector(aws_region='us-east-1')
+
+        self.expected_df = pd.DataFrame({'col1': list(range(1000)), 'col2': [str(i) for i in range(1000)]})
+        parquet_buffer = io.BytesIO()
+        self.expected_df.to_parquet(parquet_buffer)
+        self.content = parquet_buffer.getvalue()
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.client_patcher.stop()
+
+    def test_read_parquet_single_range(self):
+        """Test that an object smaller than one range is read with one request."""
+        self.connector.s3 = FakeS3Client(self.content)
+
+        result = self.connector.read_parquet('test-bucket', 'test.parquet')
+
+        pd.testing.assert_frame_equal(result, self.expected_df)
+        self.assertEqual(len(self.connector.s3.get_object_calls), 1)
+
+    def test_read_parquet_multiple_ranges(self):
+        """Test that a large object is read in ranges pinned to the first ETag."""
+        self.connector.s3 = FakeS3Client(self.content)
+        self.connector.buffer_size = 1000
+
+        result = self.connector.read_parquet('test-bucket', 'test.parquet')
+
+        pd.testing.assert_frame_equal(result, self.expected_df)
+        calls = self.connector.s3.get_object_calls
+        self.assertEqual(len(calls), -(-len(self.content) // 1000))
+        self.assertTrue(all(call['IfMatch'] == '"v1"' for call in calls[1:]))
+
+    def test_read_parquet_without_content_range(self):
+        """Test that a response ignoring the Range header is used as the whole object."""
+        self.connector.s3 = FakeS3Client(self.content, honour_range=False)
+        self.connector.buffer_size = 1000
+
+        result = self.connector.read_parquet('test-bucket', 'test.parquet')
+
+        pd.testing.assert_frame_equal(result, self.expected_df)
+        self.assertEqual(len(self.connector.s3.get_object_calls), 1)
+
+    def test_read_parquet_short_read(self):
+        """Test that a ranged GET returning too few bytes is an error."""
+        client = FakeS3Client(self.content)
+        get_object = client.get_object
+
+        def truncated_get_object(**kwargs):
+            response = get_object(**kwargs)
+            if kwargs.get('IfMatch'):
+                response['Body'] = io.BytesIO(response['Body'].read()[:10])
+            return response
+
+        client.get_object = truncated_get_object
+        self.connector.s3 = client
+        self.connector.buffer_size = 1000
+
+        with self.assertRaises(IOError):
+            self.connector.read_parquet('test-bucket', 'test.parquet')
+
+    def test_read_parquet_columns(self):
+        """Test that only the selected columns are fetched, pinned to the HEAD ETag."""
+        df = pd.DataFrame({f'col{i}': [value * i for value in range(50000)] for i in range(1, 9)})
+        parquet_buffer = io.BytesIO()
+        df.to_parquet(parquet_buffer, row_group_size=10000)
+        content = parquet_buffer.getvalue()
+        self.connector.s3 = FakeS3Client(content)
+
+        result = self.connector.read_parquet_columns(
+            'test-bucket', 'test.parquet', columns=['col1', 'col3'], filters=[('col1', '>=', 49990)]
+        )
+
+        self.assertEqual(list(result.columns), ['col1', 'col3'])
+        self.assertEqual(result['col1'].tolist(), list(range(49990, 50000)))
+        calls = self.connector.s3.get_object_calls
+        self.assertTrue(all(call['IfMatch'] == '"v1"' for call in calls))
+        fetched = sum(int(end) - int(start) + 1
+                      for start, end in (call['Range'][len('bytes='):].split('-') for call in calls))
+        # Only the footer and one row group of two columns are read
+        self.assertLess(fetched, len(content) / 4)
+
+    def test_range_file_seek(self):
+        """Test seeking the ranged-read file and rejecting an invalid whence."""
+        range_file = _S3RangeFile(FakeS3Client(b'0123456789'), 'test-bucket', 'test.bin', 10, '"v1"')
+
+        self.assertEqual(range_file.seek(-4, io.SEEK_END), 6)
+        self.assertEqual(range_file.read(2), b'67')
+        self.assertEqual(range_file.seek(-3, io.SEEK_CUR), 5)
+        self.assertEqual(range_file.read(), b'56789')
+        with self.assertRaises(ValueError):
+            range_file.seek(0, 3)
+
+    def test_delete_objects_batches(self):
+        """Test that keys are deleted in batches and failed keys map to False."""
+        keys = [f"key-{i}" for i in range(2500)]
+        self.connector.s3 = MagicMock()
+        self.connector.s3.delete_objects.side_effect = lambda Bucket, Delete: {
+            'Errors': [{'Key': obj['Key'], 'Message': 'Access Denied'}
+                       for obj in Delete['Objects'] if obj['Key'] == 'key-1234']
+        }
+
+        result = self.connector.delete_objects('test-bucket', keys)
+
+        calls = self.connector.s3.delete_objects.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sorted(len(call.kwargs['Delete']['Objects']) for call in calls),
+                         [500, DELETE_BATCH_SIZE, DELETE_BATCH_SIZE])
+        self.assertEqual(list(result), keys)
+        self.assertFalse(result['key-1234'])
+        self.assertEqual(sum(result.values()), 2499)
+
+    def test_delete_objects_empty(self):
+        """Test that deleting no keys sends no requests."""
+        self.connector.s3 = MagicMock()
+
+        self.assertEqual(self.connector.delete_objects('test-bucket', []), {})
+        self.connector.s3.delete_objects.assert_not_called()
+
+    def test_list_parquet_files(self):
+        """Test that Parquet keys are collected in order across pages."""
+        client = boto3.client('s3', region_name='us-east-1',
+                              aws_access_key_id='test', aws_secret_access_key='test')
+        stubber = Stubber(client)
+        pages = [
+            # Empty page
+            {'IsTruncated': True, 'NextContinuationToken': 'page-2', 'KeyCount': 0},
+            # Page without Parquet keys
+            {'IsTruncated': True, 'NextContinuationToken': 'page-3',
+             'Contents': [{'Key': 'data/readme.txt'}, {'Key': 'data/parquet.csv'}]},
+            # Page with mixed keys
+            {'IsTruncated': False,
+             'Contents': [{'Key': 'data/b.parquet'}, {'Key': 'data/c.json'}, {'Key': 'data/a.parquet'}]}
+        ]
+        for token, page in zip([None, 'page-2', 'page-3'], pages):
+            expected_params = {'Bucket': 'test-bucket', 'Prefix': 'data/', 'MaxKeys': 1000}
+            if token:
+                expected_params['ContinuationToken'] = token
+            stubber.add_response('list_objects_v2', page, expected_params)
+        self.connector.s3 = client
+
+        with stubber:
+            result = self.connector.list_parquet_files('test-bucket', 'data/')
+
+        self.assertEqual(result, ['data/b.parquet', 'data/a.parquet'])
+        stubber.assert_no_pending_responses()
+
+class TestS3ClientCache(unittest.TestCase):
+    """Test cases for the shared S3 client cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        S3Connector.clear_client_cache()
+        self.session_patcher = patch('datacanary.connectors.s3_connector.boto3.Session')
+        self.mock_session = self.session_patcher.start()
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.session_patcher.stop()
+        S3Connector.clear_client_cache()
+
+    def test_one_session_per_key(self):
+        """Test that connectors share a session per profile, region and credentials."""
+        with patch.dict('os.environ', {'AWS_ACCESS_KEY_ID': 'key-1'}):
+            first = S3Connector(aws_region='us-east-1')
+            second = S3Connector(aws_region='us-east-1')
+            self.assertIs(first.s3, second.s3)
+            self.assertEqual(self.mock_session.call_count, 1)
+
+            S3Connector(aws_region='eu-west-1')
+            self.assertEqual(self.mock_session.call_count, 2)
+
+        with patch.dict('os.environ', {'AWS_ACCESS_KEY_ID': 'key-2'}):
+            S3Connector(aws_region='us-east-1')
+            self.assertEqual(self.mock_session.call_count, 3)
+
+    def test_clear_client_cache(self):
+        """Test that clearing the cache creates a new session."""
+        S3Connector(aws_region='us-east-1')
+        S3Connector.clear_client_cache()
+        S3Connector(aws_region='us-east-1')
+
+        self.assertEqual(self.mock_session.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
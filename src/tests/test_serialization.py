@@ -0,0 +1,49 @@
+"""
+Tests for the JSON serialisation helpers.
+"""
+import json
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from datacanary.utils import serialization
+from datacanary.utils.serialization import dumps_json
+
+class TestSerialization(unittest.TestCase):
+    """Test cases for dumps_json."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.results = {
+            'count': np.int64(3),
+            'mean': np.float64(1.5),
+            'flag': np.bool_(True),
+            'values': np.array([1, 2]),
+            'min_date': pd.Timestamp('2020-01-01 10:00'),
+            'day': date(2020, 1, 2),
+            1: 'non-string key'
+        }
+        self.expected = {
+            'count': 3,
+            'mean': 1.5,
+            'flag': True,
+            'values': [1, 2],
+            'min_date': '2020-01-01T10:00:00',
+            'day': '2020-01-02',
+            '1': 'non-string key'
+        }
+
+    def test_dumps_json(self):
+        """Test that numpy values and dates are serialised."""
+        self.assertEqual(json.loads(dumps_json(self.results)), self.expected)
+
+    def test_dumps_json_without_orjson(self):
+        """Test that the standard library fallback gives the same values."""
+        with patch.object(serialization, 'orjson', None):
+            self.assertEqual(json.loads(dumps_json(self.results)), self.expected)
+
+if __name__ == '__main__':
+    unittest.main()
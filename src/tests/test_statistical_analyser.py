@@ -69,5 +69,31 @@ class TestStatisticalAnalyser(unittest.TestCase):
         results = self.analyser.analyse_dataframe(empty_df)
         self.assertEqual(results, {})
 
+    def test_arrow_table_input(self):
+        """Test that a pyarrow Table is analysed like the equivalent DataFrame."""
+        import pyarrow as pa
+        df = self.test_df.drop(columns=['string_col', 'all_null_col'])
+        expected = self.analyser.analyse_dataframe(df)
+        results = self.analyser.analyse_dataframe(pa.Table.from_pandas(df, preserve_index=False))
+        self.assertEqual(results.keys(), expected.keys())
+        self.assertEqual(results['numeric_col']['stats'], expected['numeric_col']['stats'])
+        self.assertEqual(results['date_col']['stats']['min_date'], expected['date_col']['stats']['min_date'])
+
+    def test_parquet_file_input(self):
+        """Test that column-wise Parquet analysis matches the DataFrame path."""
+        import os
+        import tempfile
+        import pyarrow.parquet as pq
+        df = self.test_df.drop(columns=['all_null_col'])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'test.parquet')
+            df.to_parquet(path)
+            results = self.analyser.analyse_parquet_file(pq.ParquetFile(path))
+        expected = self.analyser.analyse_dataframe(df)
+        self.assertEqual(list(results), list(expected))
+        self.assertEqual(results['numeric_col']['stats'], expected['numeric_col']['stats'])
+        self.assertEqual(results['date_col']['stats'], expected['date_col']['stats'])
+        self.assertEqual(results['string_col']['stats']['empty_string_count'], 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Tests for the SummaryStatistics class.
+"""
+import unittest
+
+from datacanary.analysis.summary_statistics import SummaryStatistics
+
+class TestSummaryStatistics(unittest.TestCase):
+    """Test cases for the SummaryStatistics class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.summary_stats = SummaryStatistics()
+
+        self.analysis_results = {
+            'id': {'type': 'int64', 'stats': {'null_percentage': 0.0, 'unique_percentage': 100.0}},
+            'name': {'type': 'object', 'stats': {'null_percentage': 20.0, 'unique_percentage': 50.0}},
+            'city': {'type': 'object', 'stats': {'null_percentage': 20.0, 'unique_percentage': 5.0}},
+            'empty': {'type': 'object', 'stats': {'null_percentage': 100.0, 'unique_percentage': 0}}
+        }
+
+    def test_calculate_summary(self):
+        """Test the dataset statistics and notable columns."""
+        summary = self.summary_stats.calculate_summary(self.analysis_results)
+
+        dataset_stats = summary['dataset_statistics']
+        self.assertEqual(dataset_stats['total_columns'], 4)
+        self.assertEqual(dataset_stats['column_types'], {'int64': 1, 'object': 3})
+        self.assertEqual(dataset_stats['columns_with_nulls'], 3)
+        self.assertEqual(dataset_stats['avg_null_percentage'], 35.0)
+        self.assertEqual(summary['data_quality_indicators']['completeness'], 65.0)
+
+        notable = summary['notable_columns']
+        self.assertEqual(notable['highest_null_column'], {'name': 'empty', 'percentage': 100.0})
+        # Columns without any unique values are ignored
+        self.assertEqual(notable['lowest_unique_column'], {'name': 'city', 'percentage': 5.0})
+
+    def test_no_notable_columns(self):
+        """Test the defaults when no column has nulls or low uniqueness."""
+        summary = self.summary_stats.calculate_summary({
+            'id': {'type': 'int64', 'stats': {'null_percentage': 0.0, 'unique_percentage': 100.0}}
+        })
+
+        notable = summary['notable_columns']
+        self.assertEqual(notable['highest_null_column'], {'name': None, 'percentage': 0})
+        self.assertEqual(notable['lowest_unique_column'], {'name': None, 'percentage': 100})
+
+    def test_get_health_score(self):
+        """Test rule compliance, column scores and the weighted health score."""
+        rule_results = {
+            'id': [{'result': {'passed': True}}, {'result': {'passed': True}}],
+            'name': [{'result': {'passed': True}}, {'result': {'passed': False}}, {'result': {}}],
+            'city': []
+        }
+        health = self.summary_stats.get_health_score(self.analysis_results, rule_results)
+
+        self.assertEqual(health['components']['rule_compliance'], 60.0)
+        self.assertEqual(health['components']['completeness'], 65.0)
+        self.assertEqual(health['health_score'], 61.5)
+        self.assertEqual(health['health_status'], 'Fair')
+        # Columns without rules get no score
+        self.assertEqual(health['column_scores'], {'id': 100.0, 'name': 33.33})
+
+    def test_empty_results(self):
+        """Test that empty results give a zeroed summary and an unknown health score."""
+        summary = self.summary_stats.calculate_summary({})
+        self.assertEqual(summary['dataset_statistics']['total_columns'], 0)
+        self.assertEqual(summary['dataset_statistics']['column_types'], {})
+        self.assertEqual(summary['data_quality_indicators']['completeness'], 0)
+        self.assertEqual(summary['notable_columns']['highest_null_column'], {'name': None, 'percentage': 0})
+
+        health = self.summary_stats.get_health_score({}, {})
+        self.assertEqual(health['health_score'], 0.0)
+        self.assertEqual(health['health_status'], 'Unknown')
+        self.assertEqual(health['column_scores'], {})
+
+if __name__ == '__main__':
+    unittest.main()
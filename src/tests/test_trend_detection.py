@@ -0,0 +1,70 @@
+"""
+Tests for the TrendDetector class.
+"""
+import unittest
+
+from datacanary.analysis.trend_detection import TrendDetector
+
+class TestTrendDetector(unittest.TestCase):
+    """Test cases for the TrendDetector class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.detector = TrendDetector()
+
+        self.analysis_results = {
+            'price': {'type': 'float64', 'stats': {
+                'count': 1000, 'null_percentage': 0.0, 'unique_percentage': 80.0,
+                'min': 1.0, 'max': 100.0, 'mean': 10.0, 'median': 8.0, 'std_dev': 5.0
+            }},
+            'quantity': {'type': 'int64', 'stats': {
+                'count': 1000, 'null_percentage': 15.0, 'unique_percentage': 0.5,
+                'min': 0.0, 'max': 10.0, 'mean': 5.0, 'median': 5.0, 'std_dev': 2.0
+            }},
+            'constant': {'type': 'int64', 'stats': {
+                'count': 1000, 'null_percentage': 0.0, 'unique_percentage': 0.1,
+                'min': 3.0, 'max': 3.0, 'mean': 3.0, 'median': 3.0, 'std_dev': 0.0
+            }},
+            'name': {'type': 'object', 'stats': {
+                'count': 50, 'null_percentage': 20.0, 'unique_percentage': 0.5
+            }}
+        }
+
+    def test_detect_outliers(self):
+        """Test that min/max values beyond 3 standard deviations are flagged."""
+        outliers = self.detector.detect_outliers(self.analysis_results)
+
+        self.assertEqual(list(outliers), ['price'])
+        self.assertEqual(outliers['price'], [
+            {'value': 100.0, 'z_score': 18.0, 'type': 'maximum'}
+        ])
+
+    def test_detect_distribution_skewness(self):
+        """Test that skewness is estimated from the mean/median difference."""
+        skewness = self.detector.detect_distribution_skewness(self.analysis_results)
+
+        self.assertEqual(list(skewness), ['price'])
+        self.assertEqual(skewness['price']['direction'], 'right-skewed')
+        self.assertEqual(skewness['price']['strength'], 'strong')
+        self.assertEqual(skewness['price']['difference_percentage'], 20.0)
+
+    def test_get_data_insights(self):
+        """Test the data quality issues and summary lines."""
+        insights = self.detector.get_data_insights(self.analysis_results)
+
+        issues = insights['data_quality_issues']
+        self.assertEqual(issues['high_null_columns'], {'quantity': 15.0, 'name': 20.0})
+        # Columns with fewer than 100 rows are not checked for uniqueness
+        self.assertEqual(issues['low_unique_columns'], {'quantity': 0.5, 'constant': 0.1})
+        self.assertEqual(len(insights['summary']), 4)
+        self.assertEqual(len(insights['recommendations']), 4)
+
+    def test_missing_statistics(self):
+        """Test that columns without the required statistics are skipped."""
+        results = {'partial': {'type': 'float64', 'stats': {'mean': 1.0}}}
+
+        self.assertEqual(self.detector.detect_outliers(results), {})
+        self.assertEqual(self.detector.detect_distribution_skewness(results), {})
+
+if __name__ == '__main__':
+    unittest.main()